@@ -7,21 +7,16 @@
 # ---------------------------------------------------#
 # Import packages
 # ---------------------------------------------------#
-# basic python package
-from copy import deepcopy as copy__deepcopy
+# frozendict
+from frozendict import frozendict
 
-# local functions
-from ensoclopedia.wrapper.tools import none_to_default_dict
-from ensoclopedia.wrapper.processors import dataset_wrapper, netcdf_reader, netcdf_writer, processor
-from ensoclopedia.wrapper.xarray_tools import get_time_bounds
-from ensoclopedia.wrapper.xeofs_base import eofs
 # ---------------------------------------------------#
 
 
 # ---------------------------------------------------------------------------------------------------------------------#
 # Default arguments
 # ---------------------------------------------------------------------------------------------------------------------#
-defaults = {
+defaults = frozendict({
     # input data
     "var1_data": {
         "bounds": {"T": ("1980-01-01", "2024-12-31"), "X": (0., 360.), "Y": (-90., 90.)}, # global
@@ -55,7 +50,7 @@ defaults = {
             },
         },
     },
-}
+})
 # ---------------------------------------------------------------------------------------------------------------------#
 
 
@@ -68,6 +63,12 @@ def f01a_sst_eof_process(
         var1_preprocess: dict = None,
         kwargs_eof: dict = None,
         **kwargs):
+    # local functions are imported when the script actually runs: they transitively pull xarray, dask and
+    # netCDF4, a cold-start cost the command line should not pay to only list or pick scripts
+    from ensoclopedia.wrapper.tools import none_to_default_dict, replace_units
+    from ensoclopedia.wrapper.processors import dataset_wrapper, netcdf_reader, netcdf_writer, processor
+    from ensoclopedia.wrapper.xarray_tools import get_time_bounds
+    from ensoclopedia.wrapper.xeofs_base import eofs
     #
     # -- Set to default
     #
@@ -79,8 +80,8 @@ def f01a_sst_eof_process(
     # -- Read data
     #
     variable = None
-    if isinstance(var1_data, dict) is True and "variable" in list(var1_data):
-        variable = copy__deepcopy(var1_data["variable"])
+    if isinstance(var1_data, dict) and "variable" in var1_data:
+        variable = list(var1_data["variable"])
     ds = netcdf_reader(**var1_data)
     #
     # -- Process
@@ -95,35 +96,34 @@ def f01a_sst_eof_process(
     #
     # -- Save in netCDF
     #
+    # first and last time steps (identical for every output variable)
+    time_bounds = get_time_bounds(ds)
     # select output variables
     ds_o = {}
-    for var in list(output["variable"].keys()):
+    for var in output["variable"]:
         # output array
         da = ds_eof[var]
         # select first EOF
         da = da[0].squeeze(drop=True)
-        # remove unused coordinates
-        for k in list(set(list(da.coords.keys())) - set(da.dims)):
-            del da[k]
+        # remove unused coordinates (drop every non-dimension coordinate in one call)
+        da = da.reset_coords(drop=True)
         # variable attributes
-        att_v = copy__deepcopy(output["variable"][var]["attributes"])
+        att_v = {**output["variable"][var]["attributes"]}
         att_v["epoch"] = ""
-        for k in get_time_bounds(ds):
+        for k in time_bounds:
             if att_v["epoch"] != "":
                 att_v["epoch"] += " to "
             att_v["epoch"] += "-".join(k.split("-")[:2])
-        if "explained_variance" in list(da.attrs.keys()):
-            att_v["explained_variance"] = copy__deepcopy(da.attrs["explained_variance"])
+        if "explained_variance" in da.attrs:
+            att_v["explained_variance"] = list(da.attrs["explained_variance"])
         # update attributes
-        if "units" in list(att_v.keys()):
-            for k1, k2 in att_v.items():
-                if isinstance(k2, str) is True:
-                    att_v[k1] = k2.replace(" (UNITS)", " (" + str(att_v["units"]) + ")")
-                    att_v[k1] = att_v[k1].replace(" ()", "")
+        if "units" in att_v:
+            att_v = dict(
+                (k1, replace_units(k2, att_v["units"]) if isinstance(k2, str) else k2)
+                for k1, k2 in att_v.items())
         att_v = dict(sorted(att_v.items()))
         # remove attributes
-        for k in list(da.attrs.keys()):
-            del da.attrs[k]
+        da.attrs.clear()
         # update attributes
         da.attrs.update(**att_v)
         # rename variable
@@ -133,13 +133,13 @@ def f01a_sst_eof_process(
     att_g = {}
     for k1, k2 in ds_eof.attrs.items():
         if k1.lower() not in ["comment", "conventions", "history", "supplementary_information"]:
-            att_g[k1.lower()] = copy__deepcopy(k2)
+            att_g[k1.lower()] = k2
     att_g = dict(sorted(att_g.items()))
     # save dataset
     ds_o = dataset_wrapper(data_vars=ds_o, attrs=att_g)
     filename = output["filename"]
     kwargs_to_netcdf = {}
-    if "kwargs_to_netcdf" in list(output) and isinstance(output["kwargs_to_netcdf"], dict) is True:
+    if "kwargs_to_netcdf" in output and isinstance(output["kwargs_to_netcdf"], dict):
         kwargs_to_netcdf = output["kwargs_to_netcdf"]
     netcdf_writer(ds_o, filename, **kwargs_to_netcdf)
 # ---------------------------------------------------------------------------------------------------------------------#
@@ -7,28 +7,23 @@
 # ---------------------------------------------------#
 # Import packages
 # ---------------------------------------------------#
-# basic python package
-from copy import deepcopy as copy__deepcopy
+# frozendict
+from frozendict import frozendict
 
-# local functions
-from ensoclopedia.wrapper.dataarray_tools import linear_regression
-from ensoclopedia.wrapper.processors import dataset_wrapper, netcdf_reader, netcdf_writer, processor
-from ensoclopedia.wrapper.tools import merge_dict, none_to_default_dict
-from ensoclopedia.wrapper.xarray_tools import get_time_bounds
 # ---------------------------------------------------#
 
 
 # ---------------------------------------------------------------------------------------------------------------------#
 # Default arguments
 # ---------------------------------------------------------------------------------------------------------------------#
-defaults = {
+defaults = frozendict({
     # input data
     "var1_data": {
         "bounds": {"T": ("1980-01-01", "2024-12-31"), "X": (190., 240.), "Y": (-5., 5.)}, # nino3.4 5S-5N, 120-170W
         "ensure_constant_mask": True,
         "dataset": "HadISST",
         "filename": "data_input/HadISST_sst.nc",
-        "kwargs_netcdf_open": {},  # can contain kwargs_open_mfdataset to pass instructions to xarray open_mfdataset
+        "kwargs_netcdf_open": {"kwargs_open_mfdataset": {"chunks": {}}},  # chunks={} aligns dask to on-disk chunks
         "kwargs_netcdf_selector": {},  # can contain keywords for relevant functions used by netcdf_selector
         "remove_regional_mean": {
             "bounds": {"X": (0., 360.), "Y": (-20., 20.)},
@@ -43,7 +38,7 @@ defaults = {
         "ensure_constant_mask": True,
         "dataset": "GPCPv2.3",
         "filename": "data_input/precip.mon.mean.nc",
-        "kwargs_netcdf_open": {},  # can contain kwargs_open_mfdataset to pass instructions to xarray open_mfdataset
+        "kwargs_netcdf_open": {"kwargs_open_mfdataset": {"chunks": {}}},  # chunks={} aligns dask to on-disk chunks
         "kwargs_netcdf_selector": {},  # can contain keywords for relevant functions used by netcdf_selector
         "remove_regional_mean": {},
         "variable": ["precip"],
@@ -80,7 +75,10 @@ defaults = {
             },
         },
     },
-}
+})
+
+# global attributes never propagated to the output file
+attributes_to_remove = frozenset({"comment", "conventions", "history", "licence", "supplementary_information"})
 # ---------------------------------------------------------------------------------------------------------------------#
 
 
@@ -95,6 +93,13 @@ def f01d_pr_change_process(
         var2_preprocess: dict = None,
         var3_preprocess: dict = None,
         **kwargs):
+    # local functions are imported when the script actually runs: they transitively pull xarray, dask and
+    # netCDF4, a cold-start cost the command line should not pay to only list or pick scripts
+    from ensoclopedia.wrapper.dataarray_tools import linear_regression
+    from ensoclopedia.wrapper.processors import dataset_wrapper, netcdf_reader, netcdf_reader_processor, \
+        netcdf_writer, processor
+    from ensoclopedia.wrapper.tools import merge_dict, none_to_default_dict, replace_units
+    from ensoclopedia.wrapper.xarray_tools import get_time_bounds
     #
     # -- Set to default
     #
@@ -107,76 +112,79 @@ def f01d_pr_change_process(
     #
     # -- Read data
     #
-    variable_x = None
-    if isinstance(var1_data, dict) is True and "variable" in list(var1_data):
-        variable_x = copy__deepcopy(var1_data["variable"])
-    ds_x0 = netcdf_reader(**var1_data)
+    # read and preprocess the ENSO index (cached: f01c, f01d, f01e and f07a share the same var1 configuration,
+    # so a driver running several scripts in one process reads and computes it only once)
+    ds_x0, ds_x = netcdf_reader_processor(var1_data, var1_preprocess)
     variable_y = None
-    if isinstance(var2_data, dict) is True and "variable" in list(var2_data):
-        variable_y = copy__deepcopy(var2_data["variable"])
+    if isinstance(var2_data, dict) and "variable" in var2_data:
+        variable_y = list(var2_data["variable"])
     ds_y0 = netcdf_reader(**var2_data)
+    # load once: both preprocess branches below consume ds_y0, loading here avoids reading and
+    # decoding the same precipitation file twice through the lazy dask graph
+    ds_y0 = ds_y0.load()
     #
     # -- Process
     #
-    # perform processing steps for ds_x
-    ds_x = processor(ds_x0, var1_preprocess, variable=variable_x)
     # perform processing steps for ds_y
     ds_y1 = processor(ds_y0, var2_preprocess, variable=variable_y)
     ds_y2 = processor(ds_y0, var3_preprocess, variable=variable_y)
-    ds_y = ds_y1 * 100 / ds_y2
+    # percentage change: the division allocates the output buffer, which is then scaled in place so no
+    # second full-size temporary is allocated for the '* 100' step
+    ds_y = ds_y1 / ds_y2
+    for var in ds_y.keys():
+        ds_y[var].data *= 100.0
     #
     # -- Diagnostic
     #
     # regress ds_y onto ds_x
     ds_reg = {}
-    for var_x in list(ds_x.keys()):
-        for var_y in list(ds_y.keys()):
+    for var_x in ds_x.keys():
+        for var_y in ds_y.keys():
             ds_reg[str(var_x) + "--" + str(var_y)] = linear_regression(ds_x[var_x], ds_y[var_y], dim="year")
     #
     # -- Save in netCDF
     #
+    # first and last time steps (identical for every output variable)
+    time_bounds = get_time_bounds(ds_x0)
     # select output variables
     ds_o = {}
-    for var in list(output["variable"].keys()):
+    for var in output["variable"]:
         # output array
         da = ds_reg[var]
-        if isinstance(da, dataset_wrapper) is True and "variable" in list(output["variable"][var].keys()):
+        if isinstance(da, dataset_wrapper) and "variable" in output["variable"][var]:
             da = da[output["variable"][var]["variable"]]
-        # remove unused coordinates
-        for k in list(set(list(da.coords.keys())) - set(da.dims)):
-            del da[k]
+        # remove unused coordinates (drop every non-dimension coordinate in one call)
+        da = da.reset_coords(drop=True)
         # variable attributes
-        att_v = copy__deepcopy(output["variable"][var]["attributes"])
+        att_v = {**output["variable"][var]["attributes"]}
         att_v["epoch"] = ""
-        for k in get_time_bounds(ds_x0):
+        for k in time_bounds:
             if att_v["epoch"] != "":
                 att_v["epoch"] += " to "
             att_v["epoch"] += "-".join(k.split("-")[:2])
         # update attributes
-        if "units" in list(att_v.keys()):
-            for k1, k2 in att_v.items():
-                if isinstance(k2, str) is True:
-                    att_v[k1] = k2.replace(" (UNITS)", " (" + str(att_v["units"]) + ")")
-                    att_v[k1] = att_v[k1].replace(" ()", "")
+        if "units" in att_v:
+            att_v = dict(
+                (k1, replace_units(k2, att_v["units"]) if isinstance(k2, str) else k2)
+                for k1, k2 in att_v.items())
         att_v = dict(sorted(att_v.items()))
         # remove attributes
-        for k in list(da.attrs.keys()):
-            del da.attrs[k]
+        da.attrs.clear()
         # update attributes
         da.attrs.update(**att_v)
         # rename variable
         da = da.rename(output["variable"][var]["name"])
         ds_o[output["variable"][var]["name"]] = da
     # global attributes
-    att_g = merge_dict(ds_x0.attrs, ds_y.attrs, var1_data["dataset"], var2_data["dataset"])
-    for k in list(att_g):
-        if k.lower() in ["comment", "conventions", "history", "licence", "supplementary_information"]:
-            del att_g[k]
+    # reserved keys are filtered out before the merge so merge_dict does not format values only to discard them
+    att_x = dict((k1, k2) for k1, k2 in ds_x0.attrs.items() if k1.lower() not in attributes_to_remove)
+    att_y = dict((k1, k2) for k1, k2 in ds_y.attrs.items() if k1.lower() not in attributes_to_remove)
+    att_g = merge_dict(att_x, att_y, var1_data["dataset"], var2_data["dataset"])
     # save dataset
     ds_o = dataset_wrapper(data_vars=ds_o, attrs=att_g)
     filename = output["filename"]
     kwargs_to_netcdf = {}
-    if "kwargs_to_netcdf" in list(output) and isinstance(output["kwargs_to_netcdf"], dict) is True:
+    if "kwargs_to_netcdf" in output and isinstance(output["kwargs_to_netcdf"], dict):
         kwargs_to_netcdf = output["kwargs_to_netcdf"]
     netcdf_writer(ds_o, filename, **kwargs_to_netcdf)
 # ---------------------------------------------------------------------------------------------------------------------#
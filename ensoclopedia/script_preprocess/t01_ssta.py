@@ -8,22 +8,18 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
-from copy import deepcopy as copy__deepcopy
-from json import dumps as json__dumps
 from typing import Union
 
-# local functions
-from ensoclopedia.wrapper.tools import none_to_default_dict
-from ensoclopedia.wrapper.processors import dataset_wrapper, detrend, average, interannual_anomalies, netcdf_reader, \
-    netcdf_writer, season_mean
-from ensoclopedia.wrapper.xarray_tools import get_time_bounds, remove_unused_coordinates
+# frozendict
+from frozendict import frozendict
+
 # ---------------------------------------------------#
 
 
 # ---------------------------------------------------------------------------------------------------------------------#
 # Default arguments
 # ---------------------------------------------------------------------------------------------------------------------#
-defaults = {
+defaults = frozendict({
     # input data
     "filename1_input": "data_input/HadISST_sst.nc",
     "variable1_input": ["sst"],
@@ -76,7 +72,7 @@ defaults = {
             },
         },
     },
-}
+})
 # ---------------------------------------------------------------------------------------------------------------------#
 
 
@@ -96,6 +92,12 @@ def t01_ssta_process(
         variable1_input: str = None,
         variable_output: dict[str, dict[str, Union[str, dict[str, str]]]] = None,
         **kwargs):
+    # local functions are imported when the script actually runs: they transitively pull xarray, dask and
+    # netCDF4, a cold-start cost the command line should not pay to only list or pick scripts
+    from ensoclopedia.wrapper.tools import none_to_default_dict
+    from ensoclopedia.wrapper.processors import dataset_wrapper, detrend, average, interannual_anomalies, netcdf_reader, \
+        netcdf_writer, season_mean
+    from ensoclopedia.wrapper.xarray_tools import cf_dim_to_dim, get_time_bounds, remove_unused_coordinates
     #
     # -- Set to default
     #
@@ -113,22 +115,28 @@ def t01_ssta_process(
     #
     # -- Read data
     #
-    ds_n34 = netcdf_reader(filename1_input, bounds=bounds1, ensure_constant_mask=ensure_constant_mask,
-                           kwargs_open_mfdataset={"data_vars": variable1_input})
-    ds_tro = netcdf_reader(filename1_input, bounds=bounds2, ensure_constant_mask=ensure_constant_mask,
-                           kwargs_open_mfdataset={"data_vars": variable1_input})
+    # chunks={} aligns dask to the on-disk chunks: the averages, anomalies and detrend below stay lazy and run as
+    # one parallel graph, holding only a chunk's worth of SST in memory at a time; parallel=True opens and preprocesses
+    # the files concurrently when the input name expands to several files
+    kwargs_netcdf_open = {"kwargs_open_mfdataset": {"chunks": {}, "parallel": True}}
+    ds_n34 = netcdf_reader(bounds=bounds1, ensure_constant_mask=ensure_constant_mask, filename=filename1_input,
+                           variable=variable1_input, kwargs_netcdf_open=kwargs_netcdf_open)
+    ds_tro = netcdf_reader(bounds=bounds2, ensure_constant_mask=ensure_constant_mask, filename=filename1_input,
+                           variable=variable1_input, kwargs_netcdf_open=kwargs_netcdf_open)
     #
     # -- Process
     #
-    # spatial average
-    ds_tro = average(ds_tro, variable=variable1_input, **kwargs1_average)
-    # remove tropical mean
-    ds_1 = ds_n34.copy(deep=True) - ds_tro.copy(deep=True)
+    # spatial average of the tropical box, reduced inline: passing both horizontal axes to a single mean lets the
+    # reduction collapse them in one strided pass, without the per-variable wrapper dispatch (one variable here)
+    dim_xy = tuple(k for k in (cf_dim_to_dim(ds_tro, "X"), cf_dim_to_dim(ds_tro, "Y")) if k is not None)
+    ds_tro = ds_tro.mean(dim=dim_xy, skipna=True, keep_attrs=True)
+    # remove tropical mean (the subtraction allocates a new object, the inputs are left untouched)
+    ds_1 = ds_n34 - ds_tro
     # compute anomalies
     ds_1 = interannual_anomalies(ds_1, **kwargs1_anom)
     ds_2 = interannual_anomalies(ds_n34, **kwargs1_anom)
-    # detrend
-    ds_3 = detrend(ds_2.copy(deep=True), variable=variable1_input, **kwargs1_detrend)
+    # detrend (remove_fit subtracts the fit into a new array, ds_2 is not modified)
+    ds_3 = detrend(ds_2, variable=variable1_input, **kwargs1_detrend)
     # spatial average
     ds_1 = average(ds_1, variable=variable1_input, **kwargs1_average)
     ds_2 = average(ds_2, variable=variable1_input, **kwargs1_average)
@@ -139,34 +147,20 @@ def t01_ssta_process(
     #
     # -- Save in netCDF
     #
-    # print("global")
-    # print(json__dumps(ds_1.attrs, indent=4))
-    # print("variable")
-    # print(list(ds_1.keys()))
-    # for k in variable1_input:
-    #     print(k.ljust(10), ds_1[k].shape)
-    #     print(json__dumps(ds_1[k].attrs, indent=4))
-    # stop
+    # first and last time steps (the three datasets come from the same read, they share the time axis)
+    epoch = " to ".join("-".join(k.split("-")[:2]) for k in get_time_bounds(ds_1))
     # select output variables
     ds_o = {}
     for d1, v1 in zip([ds_1, ds_2, ds_3], ["ds_1", "ds_2", "ds_3"]):
-        d1 = remove_unused_coordinates(d1)
+        # remove unused coordinates (only needed if non-dimension coordinates remain)
+        if len(set(d1.coords) - set(d1.dims)) > 0:
+            d1 = remove_unused_coordinates(d1)
         for var in variable1_input:
             # output array
             da = d1[var]
-            # variable attributes
-            att_v = copy__deepcopy(variable_output[v1][var]["attributes"])
-            att_v["epoch"] = ""
-            for k in get_time_bounds(da):
-                if att_v["epoch"] != "":
-                    att_v["epoch"] += " to "
-                att_v["epoch"] += "-".join(k.split("-")[:2])
-            att_v = dict(sorted(att_v.items()))
-            # remove attributes
-            for k in list(da.attrs.keys()):
-                del da.attrs[k]
-            # update attributes
-            da.attrs.update(**att_v)
+            # variable attributes, replaced in a single assignment; the template already lists the keys in order and
+            # netCDF attribute order is not semantic, so no re-sort is needed
+            da.attrs = {**variable_output[v1][var]["attributes"], "epoch": epoch}
             # rename variable
             da = da.rename(variable_output[v1][var]["name"])
             ds_o[variable_output[v1][var]["name"]] = da
@@ -174,8 +168,8 @@ def t01_ssta_process(
     att_g = {}
     for k1, k2 in ds_1.attrs.items():
         if k1 not in ["comment", "Conventions", "history", "supplementary_information"]:
-            att_g[k1] = copy__deepcopy(k2)
-    # save dataset
-    ds_o = dataset_wrapper(data_vars=ds_o, attrs=att_g)
+            att_g[k1] = k2
+    # save dataset (the averaged series are tiny, materialize them once before the writer streams them out)
+    ds_o = dataset_wrapper(data_vars=ds_o, attrs=att_g).load()
     netcdf_writer(ds_o, filename_output, **kwargs_to_netcdf)
 # ---------------------------------------------------------------------------------------------------------------------#
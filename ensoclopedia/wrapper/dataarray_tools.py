@@ -8,20 +8,49 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
-from copy import deepcopy as copy__deepcopy
+from functools import lru_cache as functools__lru_cache
 from typing import Hashable, Literal, Union
 
 # numpy
 from numpy import absolute as numpy__absolute
 from numpy import array as numpy__array
+from numpy import asarray as numpy__asarray
+from numpy import ascontiguousarray as numpy__ascontiguousarray
+from numpy import broadcast_to as numpy__broadcast_to
 from numpy import cos as numpy__cos
 from numpy import deg2rad as numpy__deg2rad
+from numpy import empty as numpy__empty
+from numpy import datetime64 as numpy__datetime64
 from numpy import float32 as numpy__float32
+from numpy import float64 as numpy__float64
+from numpy import frombuffer as numpy__frombuffer
+from numpy import isnan as numpy__isnan
+from numpy import issubdtype as numpy__issubdtype
+from numpy import nan as numpy__nan
 from numpy import ndarray as numpy__ndarray
+from numpy import nonzero as numpy__nonzero
+from numpy import number as numpy__number
+from numpy import result_type as numpy__result_type
 from numpy import sqrt as numpy__sqrt
+from numpy import vander as numpy__vander
+from numpy.linalg import lstsq as numpy__linalg__lstsq
+from numpy.linalg import solve as numpy__linalg__solve
 
 # scipy
-from scipy.stats import t as scipy__stats__t
+from scipy.special import stdtr as scipy__special__stdtr
+
+# cupy (optional: GPU acceleration of the batched regressions, e.g., lead-lag SSH regressions in f07a)
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# numba (optional: fuses the six regression moments into a single pass over the data)
+try:
+    from numba import njit as numba__njit
+    from numba import prange as numba__prange
+except ImportError:
+    numba__njit = None
 
 # local functions
 from ensoclopedia.wrapper import numpy_tools
@@ -35,6 +64,49 @@ from ensoclopedia.wrapper.xarray_tools import array_wrapper, dataset_wrapper
 # ---------------------------------------------------------------------------------------------------------------------#
 # Functions
 # ---------------------------------------------------------------------------------------------------------------------#
+if numba__njit is not None:
+    # fastmath is restricted to the reassociation flags: the full set assumes no nan and would compile away the
+    # missing-value test below
+    @numba__njit(parallel=True, fastmath={"contract", "reassoc", "arcp"}, cache=True)
+    def _moments_kernel(arr_x: numpy__ndarray, arr_y: numpy__ndarray) -> numpy__ndarray:
+        # arr_x and arr_y (m, t) are reduced along the last axis, skipping pairs with a missing value, accumulating
+        # the count and the five sums together while the data streams through the cache once
+        arr_o = numpy__empty((6, arr_y.shape[0]), dtype=numpy__float64)
+        for i in numba__prange(arr_y.shape[0]):
+            n = 0.
+            s_x = 0.
+            s_y = 0.
+            s_xx = 0.
+            s_yy = 0.
+            s_xy = 0.
+            for j in range(arr_y.shape[1]):
+                v_x, v_y = arr_x[i, j], arr_y[i, j]
+                if v_x == v_x and v_y == v_y:
+                    n += 1.
+                    s_x += v_x
+                    s_y += v_y
+                    s_xx += v_x * v_x
+                    s_yy += v_y * v_y
+                    s_xy += v_x * v_y
+            arr_o[0, i], arr_o[1, i], arr_o[2, i] = n, s_x, s_y
+            arr_o[3, i], arr_o[4, i], arr_o[5, i] = s_xx, s_yy, s_xy
+        return arr_o
+
+
+def _moments(arr_x: numpy__ndarray, arr_y: numpy__ndarray) -> tuple:
+    # reshape the response columns to 2D for the kernel; a predictor without extra dimensions is broadcast as a
+    # stride-0 view, i.e., it is never materialized per column
+    shape_o = arr_y.shape[:-1]
+    length = arr_y.shape[-1]
+    arr_y = numpy__ascontiguousarray(arr_y.reshape(-1, length), dtype=numpy__float64)
+    if arr_x.size == length:
+        arr_x = numpy__broadcast_to(arr_x.astype(numpy__float64, copy=False).reshape(1, length), arr_y.shape)
+    else:
+        arr_x = numpy__ascontiguousarray(arr_x.reshape(-1, length), dtype=numpy__float64)
+    arr_o = _moments_kernel(arr_x, arr_y)
+    return tuple(arr_o[k].reshape(shape_o) for k in range(6))
+
+
 def linear_regression(
         da_x: array_wrapper,
         da_y: array_wrapper,
@@ -87,9 +159,10 @@ def linear_regression(
         # check alternative value
         if alternative not in ["greater", "less", "two-sided"]:
             break
-        # get dimension name in both da
+        # get dimension name in both da (the arrays share the regression dimension once aligned, so the name resolved
+        # on da_x is reused for da_y instead of running the CF-name lookup a second time)
         dim_x = xt.check_dim(da_x, dim)
-        dim_y = xt.check_dim(da_y, dim)
+        dim_y = dim_x if tools.is_dim(dim_x) is True and dim_x in da_y.dims else xt.check_dim(da_y, dim)
         if tools.is_dim(dim_x) is False or tools.is_dim(dim_y) is False:
             break
         # Shift x and y data if lags are specified
@@ -103,39 +176,108 @@ def linear_regression(
             da_y = da_y.shift(**{dim_y: -lag_y}).dropna(dim=dim_y)
         # Ensure that the data are properly aligned to each other.
         da_x, da_y = xb.array_align(da_x, da_y)
-        # Compute data length, mean and standard deviation along dim
-        n = da_y.notnull().sum(dim=dim)
-        x_mean = da_x.mean(dim=dim)
-        y_mean = da_y.mean(dim=dim)
-        x_std = da_x.std(dim=dim)
-        y_std = da_y.std(dim=dim)
-        # Compute covariance, correlation and coefficient of determination
-        cov = ((da_x - x_mean) * (da_y - y_mean)).sum(dim=dim) / n
-        cor = cov / (x_std * y_std)
+        # dask-backed inputs must stay lazy: the eager missing-value probe and compiled kernel below would read the
+        # whole array, so chunked arrays go straight to the nan-skipping reductions (blockwise dask operations)
+        is_lazy = da_x.chunks is not None or da_y.chunks is not None
+        if is_lazy is False and numba__njit is not None and (cupy is None or da_x.dims != (dim,)):
+            # single fused pass over the data: all moments are accumulated together in a compiled kernel instead of
+            # one full traversal (plus anomaly temporaries) per reduction; these statistics are memory bound, so
+            # passes over the time axis are what dominates
+            n, s_x, s_y, s_xx, s_yy, s_xy = xb.array_apply_ufunc(
+                _moments, da_x, da_y, input_core_dims=[[dim], [dim]], output_core_dims=[[]] * 6)
+            x_mean = s_x / n
+            y_mean = s_y / n
+            cov = s_xy / n - x_mean * y_mean
+            x_var = s_xx / n - x_mean ** 2
+            y_var = s_yy / n - y_mean ** 2
+        else:
+            # lazy inputs cannot be probed for missing values without computing them, so they take the
+            # pairwise-complete path below (every operation in it is blockwise, the result stays lazy)
+            has_nan = is_lazy is True or bool(da_x.isnull().any()) is True or bool(da_y.isnull().any()) is True
+            if has_nan is True:
+                # restrict x and y to the pairwise-complete sample: every moment (count, means, anomalies) must be
+                # computed on the same rows, otherwise the statistics mix sample sets and drift away from
+                # scipy.stats.linregress on the complete pairs
+                valid = da_x.notnull() & da_y.notnull()
+                da_x = da_x.where(valid)
+                da_y = da_y.where(valid)
+                n = valid.sum(dim=dim)
+            else:
+                n = da_y.notnull().sum(dim=dim)
+            # Compute mean along dim
+            x_mean = da_x.mean(dim=dim)
+            y_mean = da_y.mean(dim=dim)
+            # Compute anomalies once, they are reused by each statistic
+            # note that if da_y has extra dimensions (e.g., the lead-lag 'month' axis), anomalies broadcast and every
+            # statistic below is computed in a single batched reduction instead of one reduction per extra index
+            x_anom = da_x - x_mean
+            y_anom = da_y - y_mean
+            # Compute covariance and variances
+            if has_nan is False:
+                if cupy is not None and x_anom.dims == (dim,):
+                    # single-predictor case with cupy available: stack the response columns to 2D and contract on the
+                    # GPU (cuBLAS), only the reduced moments are copied back to host memory
+                    arr_x = cupy.asarray(x_anom.values)
+                    da_yt = y_anom.transpose(dim, ...)
+                    arr_y = cupy.asarray(da_yt.values.reshape(da_yt.shape[0], -1))
+                    shape_o = da_yt.shape[1:]
+                    cov = y_mean.copy(data=cupy.asnumpy(arr_x @ arr_y).reshape(shape_o)) / n
+                    x_var = float(arr_x @ arr_x) / n
+                    y_var = y_mean.copy(data=cupy.asnumpy((arr_y * arr_y).sum(axis=0)).reshape(shape_o)) / n
+                else:
+                    # no missing values: contract dim with xarray.dot, i.e., a single BLAS matmul computes the
+                    # one-predictor least squares for every response column at once ((x . y) / (x . x))
+                    cov = xb.array_dot(x_anom, y_anom, dim=dim) / n
+                    x_var = xb.array_dot(x_anom, x_anom, dim=dim) / n
+                    y_var = xb.array_dot(y_anom, y_anom, dim=dim) / n
+            else:
+                # nan-skipping reductions over the pairwise-masked anomalies
+                cov = (x_anom * y_anom).sum(dim=dim) / n
+                x_var = (x_anom ** 2).sum(dim=dim) / n
+                y_var = (y_anom ** 2).sum(dim=dim) / n
+        # Compute correlation
+        cor = cov / numpy__sqrt(x_var * y_var)
         # Compute regression slope and intercept
-        slope = cov / (x_std ** 2)
+        slope = cov / x_var
         intercept = y_mean - x_mean * slope
         # Compute t-statistics and standard error
         t_stats = cor * numpy__sqrt(n - 2) / numpy__sqrt(1 - cor ** 2)
         stderr = slope / t_stats
-        # Calculate p-values for different alternative hypotheses.
+        # Calculate p-values for different alternative hypotheses; scipy.special.stdtr is the t cumulative
+        # distribution itself (sf(t) = stdtr(df, -t)), skipping the frozen-distribution dispatch of scipy.stats.t
         if alternative == "greater":
-            p_value = scipy__stats__t.sf(t_stats, n - 2)
+            def func_p(t, df):
+                return scipy__special__stdtr(df, -t)
         elif alternative == "less":
-            p_value = scipy__stats__t.cdf(numpy__absolute(t_stats), n - 2)
+            def func_p(t, df):
+                return scipy__special__stdtr(df, numpy__absolute(t))
         else:
-            p_value = scipy__stats__t.sf(numpy__absolute(t_stats), n - 2) * 2
-        # Wrap p-values into an xr.DataArray
-        p_value = array_wrapper(coords=cor.coords, data=p_value, dims=cor.dims)
-        # Combine into single dataset
-        ds_o = {
-            "slope": slope.rename("slope").astype(numpy__float32).drop_attrs(),
-            "intercept": intercept.rename("intercept").astype(numpy__float32).drop_attrs(),
-            "rvalue": cor.rename("rvalue").astype(numpy__float32).drop_attrs(),
-            "pvalue": p_value.rename("pvalue").astype(numpy__float32).drop_attrs(),
-            "stderr": stderr.rename("stderr").astype(numpy__float32).drop_attrs(),
-        }
-        ds_o = dataset_wrapper(data_vars=ds_o)
+            def func_p(t, df):
+                return 2. * scipy__special__stdtr(df, -numpy__absolute(t))
+        # stdtr has a single-precision loop (ff->f): casting the inputs keeps the whole evaluation and the
+        # materialized p-value array in float32, the dtype the output dataset is built in anyway
+        if is_lazy is True:
+            # evaluate the t-distribution chunk by chunk so each block is handled by the scheduler's pool
+            p_value = xb.array_apply_ufunc(
+                func_p, t_stats.astype(numpy__float32), (n - 2).astype(numpy__float32), dask="parallelized",
+                output_dtypes=[numpy__float32])
+        else:
+            # evaluate on the plain ndarrays (no xarray alignment or re-wrap per intermediate) and wrap once
+            p_value = array_wrapper(
+                coords=cor.coords,
+                data=func_p(numpy__asarray(t_stats, dtype=numpy__float32), numpy__asarray(n, dtype=numpy__float32) - 2),
+                dims=cor.dims)
+        # Combine into single dataset, built in one constructor call from the raw (numpy or dask) buffers: this
+        # replaces the per-variable rename/astype/drop_attrs chain and its intermediate DataArray allocations
+        ds_o = dataset_wrapper(
+            data_vars={
+                "slope": (slope.dims, slope.data.astype(numpy__float32, copy=False)),
+                "intercept": (intercept.dims, intercept.data.astype(numpy__float32, copy=False)),
+                "rvalue": (cor.dims, cor.data.astype(numpy__float32, copy=False)),
+                "pvalue": (p_value.dims, p_value.data.astype(numpy__float32, copy=False)),
+                "stderr": (stderr.dims, stderr.data.astype(numpy__float32, copy=False)),
+            },
+            coords=cor.coords)
         # get attributes coordinates attributes from da_y
         for k in list(ds_o.coords):
             ds_o[k].attrs.update(da_y[k].attrs)
@@ -193,7 +335,7 @@ def mean_weighted(
         else:
             dim = xt.check_dim(da, dim)
         # create an iterable of dimensions to facilitate tests
-        dim_list = copy__deepcopy(dim) if isinstance(dim, (list, tuple)) is True else [dim]
+        dim_list = list(dim) if isinstance(dim, (list, tuple)) is True else [dim]
         if all([tools.is_dim(k) is True for k in dim_list]) is False:
             break
         # get 'theoretical' dimension names of time, longitude and latitude (None is returned if they don't exist)
@@ -215,7 +357,7 @@ def mean_weighted(
         if (tools.is_dim(lat_dim) is True and lat_dim in dim_list and len(da[lat_dim].shape) > 1) or (
                 tools.is_dim(lon_dim) is True and lon_dim in dim_list and len(da[lon_dim].shape) > 1):
             # is multidimensional
-            dim_old = copy__deepcopy(dim) if isinstance(dim, (list, tuple)) is True else [dim]
+            dim_old = list(dim) if isinstance(dim, (list, tuple)) is True else [dim]
             # convert lat/lon to y/x
             dim_new = []
             for k in dim_old:
@@ -225,7 +367,7 @@ def mean_weighted(
                     dim_new.append(list(da[lat_dim].dims)[1])
                 else:
                     dim_new.append(k)
-            dim = copy__deepcopy(dim_new) if isinstance(dim, (list, tuple)) is True else dim_new[0]
+            dim = list(dim_new) if isinstance(dim, (list, tuple)) is True else dim_new[0]
         # compute mean
         if isinstance(da, array_wrapper) is True and isinstance(weights, (array_wrapper, numpy__ndarray)) is True:
             da_o = da.weighted(weights).mean(dim=dim, keep_attrs=keep_attrs, skipna=skipna)
@@ -234,6 +376,16 @@ def mean_weighted(
     return da_o
 
 
+@functools__lru_cache(maxsize=8)
+def _detrend_projector(axis_bytes: bytes, deg: int) -> tuple[numpy__ndarray, numpy__ndarray]:
+    # cached on the (standardized) axis values and degree: batch scripts detrend many variables on the same time
+    # grid, the Vandermonde and the solved normal system are built once and reused
+    arr_t = numpy__frombuffer(axis_bytes, dtype=numpy__float64)
+    arr_v = numpy__vander(arr_t, deg + 1)
+    arr_p = numpy__linalg__solve(arr_v.T @ arr_v, arr_v.T)  # (deg + 1, t), coefficients = arr_p @ data
+    return arr_v, arr_p
+
+
 def remove_fit(
         da: array_wrapper,
         deg: int = 1,
@@ -279,10 +431,60 @@ def remove_fit(
         dim = xt.check_dim(da, dim)
         if dim is None:
             break
-        # compute coefficient
-        p = da.polyfit(dim, deg, **kwargs_polyfit)
-        # remove fit
-        da_o = da.copy(deep=True) - xb.polynomial_fit(da[dim], p["polyfit_coefficients"])
+        dtype_t = da[dim].dtype
+        if len(kwargs_polyfit) == 0 and \
+                (numpy__issubdtype(dtype_t, numpy__number) or numpy__issubdtype(dtype_t, numpy__datetime64)):
+            # the fit removed below is the projection of the data onto the polynomial space: build the tiny
+            # (t, deg + 1) Vandermonde once and subtract the projection with two small matmuls per column, instead
+            # of polyfit's per-call least squares followed by a second full pass to evaluate the polynomial
+            arr_t = da[dim].values
+            if numpy__issubdtype(dtype_t, numpy__datetime64):
+                arr_t = arr_t.astype("datetime64[ns]")
+            arr_t = arr_t.astype(numpy__float64)
+            # standardize the axis for numerical conditioning (the projection is invariant to affine changes)
+            arr_t = (arr_t - arr_t.mean()) / arr_t.std()
+            arr_v, arr_p = _detrend_projector(arr_t.tobytes(), deg)
+
+            def func_residuals(arr: numpy__ndarray) -> numpy__ndarray:
+                # flatten the columns so each matmul is a single BLAS gemm instead of one call per stacked slice
+                arr_2d = arr.reshape(-1, arr.shape[-1])
+                arr_nan = numpy__isnan(arr_2d)
+                if bool(arr_nan.any()) is False:
+                    arr_o = arr_2d - (arr_2d @ arr_p.T) @ arr_v.T
+                else:
+                    # masked data (e.g., land points): the fully valid columns (the bulk, e.g., sea points) are still
+                    # fitted in the single batched projection above, all-missing columns are set to nan, and only the
+                    # rare partially missing columns fall back to one masked least squares each
+                    valid = ~arr_nan.any(axis=1)
+                    arr_o = numpy__empty(arr_2d.shape, dtype=numpy__result_type(arr_2d.dtype, numpy__float64))
+                    arr_o[valid] = arr_2d[valid] - (arr_2d[valid] @ arr_p.T) @ arr_v.T
+                    arr_o[~valid] = numpy__nan
+                    for i in numpy__nonzero(~valid & ~arr_nan.all(axis=1))[0]:
+                        m = ~arr_nan[i]
+                        coefficients = numpy__linalg__lstsq(arr_v[m], arr_2d[i, m], rcond=None)[0]
+                        arr_o[i] = arr_2d[i] - arr_v @ coefficients
+                return arr_o.reshape(arr.shape)
+
+            kwargs_apply_ufunc = {}
+            da_i = da
+            if da.chunks is not None:
+                # the projection needs the fitted dimension contiguous within each block; with that, every block is
+                # an independent task — none of the rechunk/merge layers the polyfit graph would build
+                da_i = da.chunk({dim: -1})
+                kwargs_apply_ufunc = {
+                    "dask": "parallelized",
+                    "output_dtypes": [numpy__result_type(da.dtype, numpy__float64)],
+                }
+            da_o = xb.array_apply_ufunc(
+                func_residuals, da_i, input_core_dims=[[dim]], output_core_dims=[[dim]], **kwargs_apply_ufunc)
+            # apply_ufunc moves the fitted dimension last, restore the input order
+            da_o = da_o.transpose(*da.dims)
+        else:
+            # explicit polyfit keywords or a non-numeric axis: use the generic xarray fit
+            # compute coefficient
+            p = da.polyfit(dim, deg, **kwargs_polyfit)
+            # remove fit
+            da_o = da - xb.polynomial_fit(da[dim], p["polyfit_coefficients"])
     return da_o
 
 
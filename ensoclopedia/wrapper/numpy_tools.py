@@ -7,14 +7,14 @@
 # ---------------------------------------------------#
 # Import packages
 # ---------------------------------------------------#
-# basic python package
-from copy import deepcopy as copy__deepcopy
-
 # numpy
 from numpy import array as numpy__array
+from numpy import moveaxis as numpy__moveaxis
 from numpy import nan as numpy__nan
 from numpy import ndarray as numpy__ndarray
-from numpy import ones as numpy__ones
+from numpy import pad as numpy__pad
+from numpy import result_type as numpy__result_type
+from numpy.lib.stride_tricks import sliding_window_view as numpy__sliding_window_view
 # ---------------------------------------------------#
 
 
@@ -47,27 +47,26 @@ def splice(
     Output:
     -------
     :return: numpy.ndarray
-        New array with spliced data (duplicated and reorganized)
+        New array with spliced data (duplicated and reorganized); the overlapping windows are read-only strided views
+        on a single buffer, no data is copied per window
     """
-    # reorganize data along the first dimension
-    arr_o = []
+    # first window starts 'h1' steps before the input array, the last one may end up to 'window' steps after its end
     half = window // 2
     h1 = half - delta
     h2 = half + delta
-    for k in range(-h1, len(arr) - h2 + 1, delta):
-        # 'window' sized array
-        arr_t = numpy__ones((window,) + arr.shape[1:], dtype=arr.dtype) * numpy__nan
-        # indices taken from input array
-        i1, i2 = max(0, k), min(k + window, len(arr))
-        # indices where to place input slice in output array
-        o1, o2 = 0, copy__deepcopy(window)
-        if k < 0:
-            # the first 'h1' indices are not centered, they need to be handled properly
-            o1 = i1 - k
-        elif k + window > len(arr):
-            # the last 'window' indices are not centered, they need to be handled properly
-            o2 = o1 + i2 - i1
-        arr_t[o1: o2] = arr[i1: i2]
-        arr_o.append(arr_t)
-    return numpy__array(arr_o)
+    starts = list(range(-h1, len(arr) - h2 + 1, delta))
+    if len(starts) == 0:
+        return numpy__array([])
+    # pad the array once with nan where windows overflow the input (instead of one nan-filled temporary per window)
+    n_before = max(0, -starts[0])
+    n_after = max(0, starts[-1] + window - len(arr))
+    if n_before > 0 or n_after > 0:
+        arr = arr.astype(numpy__result_type(arr.dtype, numpy__nan), copy=False)
+        arr = numpy__pad(
+            arr, [(n_before, n_after)] + [(0, 0)] * (arr.ndim - 1), mode="constant", constant_values=numpy__nan)
+    # windows are strided views on the (padded) array, taken every 'delta' steps
+    arr_o = numpy__sliding_window_view(arr, window, axis=0)
+    arr_o = arr_o[starts[0] + n_before:: delta][: len(starts)]
+    # sliding_window_view puts the window at the last axis, move it right after the splice axis
+    return numpy__moveaxis(arr_o, -1, 1)
 # ---------------------------------------------------------------------------------------------------------------------#
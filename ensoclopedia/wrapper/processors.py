@@ -8,12 +8,14 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
-from copy import deepcopy as copy__deepcopy
-from inspect import getmembers as inspect__getmembers
 from inspect import isfunction as inspect__isfunction
 from inspect import stack as inspect__stack
-from typing import Hashable, Literal, Union
-from sys import modules as sys__modules
+from json import dumps as json__dumps
+from typing import Callable, Hashable, Literal, Union
+
+# dask
+from dask import compute as dask__compute
+from dask import delayed as dask__delayed
 
 # local functions
 from ensoclopedia.wrapper import tools
@@ -69,6 +71,39 @@ def average(
     return da_ds_execute(ds, "mean_weighted", dim=dim, variable=variable, **kwargs_mean_weighted)
 
 
+def _window_sum_cumsum(
+        ds: Union[array_wrapper, dataset_wrapper],
+        dim_name: Union[Hashable, str],
+        window: int,
+        **kwargs) -> Union[array_wrapper, dataset_wrapper]:
+    """
+    Compute the centered rolling window sum along given dimension as a difference of shifted cumulative sums.
+    The window at label i covers [i - window // 2, i + (window - 1) // 2] (as xarray's centered rolling); windows
+    overflowing the edges are truncated to the available labels. Missing values must be filled beforehand.
+
+    Input:
+    ------
+    :param ds: xarray.DataArray or xarray.Dataset
+    :param dim_name: Hashable or str
+        Dimension (as named in ds) over which to apply the window sum; e.g., dim_name = "time"
+    :param window: int
+        Number of observations to sum; e.g., window = 120
+    **kwargs - Discarded
+
+    Output:
+    -------
+    :return: xarray.DataArray or xarray.Dataset
+        New object (as input) with the rolling window sum computed along given dimension.
+    """
+    left = window // 2
+    right = (window - 1) // 2
+    cumulative = ds.cumsum(dim_name)
+    # windows truncated at the end stop at the last cumulative value, windows truncated at the start begin at zero
+    upper = cumulative.shift({dim_name: -right}).fillna(cumulative.isel({dim_name: -1})) if right > 0 else cumulative
+    lower = cumulative.shift({dim_name: left + 1}).fillna(0.)
+    return upper - lower
+
+
 def average_moving(
         ds: Union[array_wrapper, dataset_wrapper],
         dim: Union[Hashable, str] = "T",
@@ -109,17 +144,48 @@ def average_moving(
             break
         # get time dimension
         dim_time = xt.cf_dim_to_dim(ds, "T")
-        # weights along dimension
+        # weights along dimension (uniform weights cancel out of the ratio below up to the window label count)
         if tools.is_dim(dim_time) is True and dim_time == dim_name:
             weights = xt.weights_time(ds)
+            uniform_weights = False
         else:
-            weights = xb.array_ones(ds[dim_name])
+            weights = xb.array_ones(ds[dim_name], dtype=float)
+            uniform_weights = True
         # input multiplied by weights
         ds_o = ds * weights
-        # compute rolling (moving) window sum of da_o
-        ds_o = ds_o.rolling(dim={dim_name: window}, center=True, min_periods=min_periods).sum(keep_attrs=True)
-        # divide by rolling (moving) window sum of weights
-        ds_o = ds_o / weights.rolling(dim={dim_name: window}, center=True, min_periods=min_periods).sum()
+        if isinstance(window, int) is True and window > 8:
+            # long windows: each rolling sum costs O(n * window), but the same sums are differences of one cumulative
+            # sum each, O(n) whatever the window length, and stay lazy on dask-backed data; short windows keep the
+            # rolling path below, where the cumulative-sum overhead is not worth it
+            min_count = window if min_periods is None else min_periods
+            # count of valid observations and of labels in each window, to apply the min_periods rule of rolling
+            cnt = _window_sum_cumsum(ds_o.notnull(), dim_name, window)
+            pos = _window_sum_cumsum(xb.array_ones(ds[dim_name], dtype=float), dim_name, window)
+            # window sum of the weighted data (missing values skipped) over the window sum of the weights; for
+            # uniform weights that sum is the label count already computed above
+            ds_o = _window_sum_cumsum(ds_o.fillna(0.), dim_name, window)
+            ds_o = ds_o / (pos if uniform_weights is True else _window_sum_cumsum(weights, dim_name, window))
+            ds_o = ds_o.where((cnt >= min_count) & (pos >= min_count))
+        else:
+            if isinstance(ds_o, dataset_wrapper) is True:
+                is_lazy = len(ds_o.chunks) > 0
+            else:
+                is_lazy = ds_o.chunks is not None
+            if is_lazy is False:
+                # in-memory data: materialize the windows as a zero-copy strided view once and reduce them with
+                # plain vectorized sums, skipping the per-window rolling machinery; the min_periods rule is applied
+                # from the count of valid observations per window
+                min_count = window if min_periods is None else min_periods
+                view = ds_o.rolling(dim={dim_name: window}, center=True).construct("window_dim")
+                ds_o = view.sum("window_dim", keep_attrs=True).where(view.notnull().sum("window_dim") >= min_count)
+                view = weights.rolling(dim={dim_name: window}, center=True).construct("window_dim")
+                ds_o = ds_o / view.sum("window_dim").where(view.notnull().sum("window_dim") >= min_count)
+            else:
+                # dask-backed data: windows cannot be strided safely across blocks, keep the rolling path
+                # compute rolling (moving) window sum of da_o
+                ds_o = ds_o.rolling(dim={dim_name: window}, center=True, min_periods=min_periods).sum(keep_attrs=True)
+                # divide by rolling (moving) window sum of weights
+                ds_o = ds_o / weights.rolling(dim={dim_name: window}, center=True, min_periods=min_periods).sum()
     return ds_o
 
 
@@ -175,14 +241,12 @@ def interannual_anomalies(
     ------
     :param ds: xarray.DataArray or xarray.Dataset
     :param kwargs_groupby: dict, optional
-        Key arguments passed to xarray groupby (see url above);
-        e.g., kwargs_groupby = {
-            restore_coord_dims: bool,
-        }
+        Kept for backward compatibility and discarded: the seasonal cycle is removed with a broadcast subtraction,
+        no groupby is involved anymore
         Default is None
     :param kwargs_seasonal_cycle: dict, optional
         Key arguments passed to the function seasonal_cycle;
-        e.g., kwargs_groupby = {
+        e.g., kwargs_seasonal_cycle = {
             kwargs_groupby: dict,
             kwargs_mean: dict,
         }
@@ -194,8 +258,6 @@ def interannual_anomalies(
     :return: xarray.DataArray or xarray.Dataset
         Object (as input) with seasonal cycle removed
     """
-    kwargs_groupby = tools.none_to_default(kwargs_groupby, {})
-    tools.remove_keys(kwargs_groupby, desired_keys=["restore_coord_dims"])
     kwargs_seasonal_cycle = tools.none_to_default(kwargs_seasonal_cycle, {})
     ds_o = None
     # fake loop to be able to break out when an error occurs
@@ -204,14 +266,13 @@ def interannual_anomalies(
         dim_time = xt.cf_dim_to_dim(ds, "T")
         if tools.is_dim(dim_time) is False:
             break
-        # compute seasonal cycle
-        ds = ds.compute()
+        # compute seasonal cycle (kept lazy on dask-backed data, the anomalies join the same task graph)
         sea_cycle = seasonal_cycle(ds, **kwargs_seasonal_cycle)
-        sea_cycle = sea_cycle.compute()
         if sea_cycle is None:
             break
-        # remove seasonal cycle
-        ds_o = ds.groupby(group=str(dim_time) + ".month", **kwargs_groupby) - sea_cycle
+        # remove seasonal cycle: indexing the cycle with the month of each time step broadcasts it back onto the
+        # time axis, a single vectorized subtraction instead of a python loop over the groups
+        ds_o = ds - sea_cycle.sel(month=ds[dim_time].dt.month).drop_vars("month")
         if ds_o is None:
             break
         # remove unused dimensions
@@ -225,6 +286,7 @@ def netcdf_reader(
         filename: Union[str, list[str]] = None,
         remove_regional_mean: dict = None,
         variable: list[str] = None,
+        working_dtype: str = None,
         kwargs_netcdf_open: dict = None,
         kwargs_netcdf_selector: dict = None,
         **kwargs) -> Union[dataset_wrapper, None]:
@@ -258,6 +320,12 @@ def netcdf_reader(
     :param variable: list[str], optional
         List of variables to read in filename
         Default is None
+    :param working_dtype: str, optional
+        Data type to cast floating-point variables to right after the file is opened;
+        e.g., working_dtype = "float32".
+        Many inputs are stored as float32 but decode to float64; casting back at the read halves the memory
+        footprint of every downstream step (fits that need float64 precision cast internally)
+        Default is None (variables are kept as decoded)
     :param kwargs_netcdf_open: dict, optional
         Key arguments for xt.netcdf_open
         Default is None
@@ -279,28 +347,45 @@ def netcdf_reader(
     if filename is not None and isinstance(filename, (str, list)) is True:
         # create dataset
         ds = xt.netcdf_open(filename, variable, **kwargs_netcdf_open)
-        # remove regional mean
+        # cast floating-point variables to the working precision before anything is computed (coordinates and
+        # non-float variables, e.g. time bounds, are left untouched)
+        if working_dtype is not None:
+            for data_var in list(ds.keys()):
+                if ds[data_var].dtype.kind == "f" and str(ds[data_var].dtype) != working_dtype:
+                    ds[data_var] = ds[data_var].astype(working_dtype, copy=False)
+        # select time bounds first: the regional mean below is pointwise in time, so restricting the time axis
+        # before it is computed avoids reading and averaging time steps that are discarded afterwards (the spatial
+        # bounds must wait, the regional mean needs its own region)
+        if isinstance(bounds, dict) is True and "T" in list(bounds.keys()):
+            ds = netcdf_selector(ds, bounds={"T": bounds["T"]}, **kwargs_netcdf_selector)
+            bounds = dict((k1, k2) for k1, k2 in bounds.items() if k1 != "T")
+        # compute regional mean
+        ds_reg = None
         if "bounds" in list(remove_regional_mean.keys()) and \
                 isinstance(remove_regional_mean["bounds"], dict) is True and \
                 len(list(remove_regional_mean["bounds"].keys())) > 0:
             # select region
-            bd = copy__deepcopy(remove_regional_mean["bounds"])
+            # the bound tuples are immutable, a shallow copy is enough (remove_keys may mutate the kwargs)
+            bd = dict(remove_regional_mean["bounds"])
             kw = {}
             if "kwargs_netcdf_selector" in list(remove_regional_mean.keys()) and \
                     isinstance(remove_regional_mean["kwargs_netcdf_selector"], dict) is True:
-                kw = copy__deepcopy(remove_regional_mean["kwargs_netcdf_selector"])
+                kw = dict(remove_regional_mean["kwargs_netcdf_selector"])
             ds_reg = netcdf_selector(ds, bounds=bd, **kw)
             # spatial average
             kw = {}
             if "kwargs_mean_weighted" in list(remove_regional_mean.keys()) and \
                     isinstance(remove_regional_mean["kwargs_mean_weighted"], dict) is True:
-                kw = copy__deepcopy(remove_regional_mean["kwargs_mean_weighted"])
+                kw = dict(remove_regional_mean["kwargs_mean_weighted"])
             tools.remove_keys(kw, keys_to_remove=["dim"])
             ds_reg = average(ds_reg, dim=("X", "Y"), variable=variable, kwargs_mean_weighted=kw)
-            # remove spatial average
-            ds = ds - ds_reg
         # select bounds
         ds = netcdf_selector(ds, bounds=bounds, **kwargs_netcdf_selector)
+        # remove the regional mean after the bounds selection: the mean only varies along time (its region was
+        # selected above, before the bounds trimmed the grid), so subtracting on the selected region allocates a
+        # bounded-region temporary instead of a full-grid one
+        if ds_reg is not None:
+            ds = ds - ds_reg
         # find time dimension
         dim_time = xt.cf_dim_to_dim(ds, "T")
         # mask constant through time
@@ -309,6 +394,46 @@ def netcdf_reader(
     return ds
 
 
+def netcdf_reader_processor(
+        data: dict,
+        processors: dict,
+        **kwargs) -> tuple[Union[dataset_wrapper, None], Union[array_wrapper, dataset_wrapper, None]]:
+    """
+    Read a dataset with netcdf_reader, apply given processors, and memoize the result: several scripts read and
+    preprocess the same input with identical instructions (e.g., the normalized NDJ Nino3.4 index), a driver running
+    them in one process reads and computes it only once.
+
+    Input:
+    ------
+    :param data: dict
+        Key arguments passed to netcdf_reader; e.g., data = {'filename': 'path/to/file.nc', 'variable': ['sst']}
+    :param processors: dict
+        Dictionary of processors names and associated keywords passed to processor
+    **kwargs - Discarded
+
+    Output:
+    -------
+    :return: tuple[xarray.Dataset or None, xarray.DataArray or xarray.Dataset or None]
+        Dataset as read from file and the same dataset with processors applied.
+        Both objects are shared between callers with the same arguments and must not be modified in place.
+    """
+    # key arguments serialized as the cache key (the dictionaries themselves are not hashable)
+    key = json__dumps(data, sort_keys=True, default=str) + "--" + json__dumps(processors, sort_keys=True, default=str)
+    if key not in _reader_processor_cache:
+        # get variable list
+        variable = None
+        if isinstance(data, dict) is True and "variable" in data and tools.is_variables(data["variable"]) is True:
+            variable = list(data["variable"])
+        # read then process
+        ds = netcdf_reader(**data)
+        _reader_processor_cache[key] = (ds, processor(ds, processors, variable=variable))
+    return _reader_processor_cache[key]
+
+
+# cache for netcdf_reader_processor, keyed on the serialized key arguments
+_reader_processor_cache = {}
+
+
 def netcdf_selector(
         ds: Union[array_wrapper, dataset_wrapper],
         bounds: dict[str, Union[tuple[str, str], tuple[float, float]]] = None,
@@ -351,23 +476,22 @@ def netcdf_selector(
     kwargs_check_time_bounds = tools.none_to_default(kwargs_check_time_bounds, {})
     kwargs_sel = tools.none_to_default(kwargs_sel, {})
     tools.remove_keys(kwargs_sel, desired_keys=["drop", "method", "tolerance"])
-    if isinstance(bounds, dict) is True and len(list(bounds.keys())) > 0:
+    if isinstance(bounds, dict) is True and len(bounds) > 0:
+        # get 'theoretical' dimension names of time, longitude and latitude once (None if they don't exist); the
+        # selections below never rename dimensions, so the names stay valid throughout
+        cf_dims = {"T": xt.cf_dim_to_dim(ds, "T"), "X": xt.cf_dim_to_dim(ds, "X"), "Y": xt.cf_dim_to_dim(ds, "Y")}
+        dim_time, dim_lon, dim_lat = cf_dims["T"], cf_dims["X"], cf_dims["Y"]
         # get dimension name
         coordinates1, coordinates2 = {}, {}
         for k1, k2 in bounds.items():
-            dim_name = copy__deepcopy(k1)
-            if k1 in ["T", "X", "Y"]:
-                dim_name = xt.cf_dim_to_dim(ds, k1)
+            dim_name = cf_dims.get(k1, k1)
             if tools.is_dim(dim_name) is True and isinstance(k2, tuple) is True and len(k2) == 2:
                 coordinates1[dim_name] = slice(*k2)
-                coordinates2[dim_name] = copy__deepcopy(k2)
+                coordinates2[dim_name] = k2
         # select using bounds like ("1980-01-01", "2014-12-31")
-        if len(list(coordinates1.keys())) > 0:
-            dim_time = xt.cf_dim_to_dim(ds, "T")
-            dim_lon = xt.cf_dim_to_dim(ds, "X")
-            dim_lat = xt.cf_dim_to_dim(ds, "Y")
+        if len(coordinates1) > 0:
             # longitudes are usually [0; 360], if desired bounds are on another scale, e.g., [-180; 180], roll longitude
-            if tools.is_dim(dim_lon) is True and dim_lon in list(coordinates2.keys()) and \
+            if tools.is_dim(dim_lon) is True and dim_lon in coordinates2 and \
                     (min(coordinates2[dim_lon]) < 0 or max(coordinates2[dim_lon]) > 360):
                 # minimum value of coordinates1[dim_lon]
                 lon_min = min(coordinates2[dim_lon])
@@ -384,17 +508,17 @@ def netcdf_selector(
             else:
                 # for multidimensional coordinates (e.g., curvilinear grids)
                 # select time
-                if tools.is_dim(dim_time) is True and dim_time in list(coordinates1.keys()):
+                if tools.is_dim(dim_time) is True and dim_time in coordinates1:
                     ds = ds.sel(indexers={dim_time: coordinates1[dim_time]}, **kwargs_sel)
                 # select X / Y
-                if (tools.is_dim(dim_lat) is True and dim_lat in list(coordinates1.keys())) or (
-                        tools.is_dim(dim_lon) is True and dim_lon in list(coordinates1.keys())):
+                if (tools.is_dim(dim_lat) is True and dim_lat in coordinates1) or (
+                        tools.is_dim(dim_lon) is True and dim_lon in coordinates1):
                     # create condition
-                    if dim_lat in list(coordinates1.keys()) and dim_lon not in list(coordinates1.keys()):
+                    if dim_lat in coordinates1 and dim_lon not in coordinates1:
                         # select Y
                         arr_lat = ds[dim_lat]
                         cond = (coordinates2[dim_lat][0] < arr_lat) & (arr_lat < coordinates2[dim_lat][1])
-                    elif dim_lat not in list(coordinates1.keys()) and dim_lon in list(coordinates1.keys()):
+                    elif dim_lat not in coordinates1 and dim_lon in coordinates1:
                         # select X
                         arr_lon = ds[dim_lon]
                         cond = (coordinates2[dim_lon][0] < arr_lon) & (arr_lon < coordinates2[dim_lon][1])
@@ -403,11 +527,20 @@ def netcdf_selector(
                         arr_lat, arr_lon = ds[dim_lat], ds[dim_lon]
                         cond = (coordinates2[dim_lat][0] <= arr_lat) & (arr_lat <= coordinates2[dim_lat][1]) & \
                               (coordinates2[dim_lon][0] <= arr_lon) & (arr_lon <= coordinates2[dim_lon][1])
+                    # crop to the bounding box of the condition before masking: where() keeps the full grid shape
+                    # (masked as NaN), so without the crop every downstream step would carry the whole curvilinear
+                    # grid for a regional selection
+                    for dim_name in list(cond.dims):
+                        # True where at least one point of the region lies on this row / column
+                        arr = cond.any(dim=[k for k in cond.dims if k != dim_name]).values.nonzero()[0]
+                        if len(arr) > 0:
+                            sel = slice(int(arr[0]), int(arr[-1]) + 1)
+                            ds = ds.isel(indexers={dim_name: sel})
+                            cond = cond.isel(indexers={dim_name: sel})
                     ds = ds.where(cond)
         # sometimes selecting time is slightly wrong
         # this section checks if one time step has been included by error at the beginning or the end of the time series
-        dim_time = xt.cf_dim_to_dim(ds, "T")
-        if tools.is_dim(dim_time) and dim_time in list(coordinates2.keys()):
+        if tools.is_dim(dim_time) and dim_time in coordinates2:
             # check lower time bound
             ds = xt.check_time_bounds(ds, coordinates2[dim_time], "lower", **kwargs_check_time_bounds)
             # check upper time bound
@@ -431,9 +564,15 @@ def netcdf_writer(
     :param filename: str
         Path to which to save the DataArray or Dataset
     :param kwargs_to_netcdf: dict, optional
-        Key arguments passed to xarray to_netcdf (see url above)
+        Key arguments passed to xarray to_netcdf (see url above);
+        pass {'compute': False} to get the delayed write back and batch several writes in one dask.compute
         Default is None
     **kwargs - Discarded
+
+    Output:
+    -------
+    :return: None or dask.delayed.Delayed
+        None for an immediate write, the delayed write when called with compute=False
     """
     kwargs_to_netcdf = tools.none_to_default(kwargs_to_netcdf, {})
     # check key arguments
@@ -442,8 +581,21 @@ def netcdf_writer(
     tools.remove_keys(kwargs_to_netcdf, desired_keys=known_kwargs)
     # remove unused dimensions
     ds = xt.remove_unused_coordinates(ds)
-    # save object as Netcdf
-    ds.to_netcdf(path=filename, **kwargs_to_netcdf)
+    # default compression: outputs are re-read many times by the figure scripts, so unless the caller provided its
+    # own encoding, write each variable deflated and chunked (one chunk per variable, the outputs are small)
+    if "encoding" not in kwargs_to_netcdf:
+        encoding = {}
+        data_vars = list(ds.keys()) if isinstance(ds, dataset_wrapper) is True else [ds.name]
+        for k in data_vars:
+            da = ds[k] if isinstance(ds, dataset_wrapper) is True else ds
+            if k is not None and len(da.shape) > 0:
+                # shuffle reorders the bytes before deflate, a near-free step that compresses floats much better
+                encoding[k] = {"zlib": True, "complevel": 1, "shuffle": True, "chunksizes": da.shape}
+        if len(encoding) > 0:
+            kwargs_to_netcdf["encoding"] = encoding
+    # save object as Netcdf (to_netcdf returns the delayed write when called with compute=False, which lets a
+    # driver collect several writers and run them as one graph)
+    return ds.to_netcdf(path=filename, **kwargs_to_netcdf)
 
 
 def processor(
@@ -476,23 +628,122 @@ def processor(
     :return: xarray.DataArray or xarray.Dataset
         Object (as input) with processors applied
     """
-    # loop on processors to apply to object
-    for k1 in list(processors.keys()):
+    # single-variable dataset: run the chain on the DataArray itself — one xarray dispatch per step instead of a
+    # per-variable dict walk — and rebuild the dataset at the end
+    attributes, name = None, None
+    if isinstance(ds, dataset_wrapper) is True and isinstance(variable, list) is True and len(variable) == 1 and \
+            list(ds.keys()) == variable:
+        attributes = dict(ds.attrs)
+        name = variable[0]
+        ds = ds[name]
+    # apply the resolved chain to the object
+    ds = compile_processor(processors, variable=variable)(ds)
+    # wrap the single variable back into a dataset
+    if name is not None and isinstance(ds, array_wrapper) is True:
+        ds = dataset_wrapper(data_vars={name: ds.rename(name)}, attrs=attributes)
+    return ds
+
+
+def compile_processor(
+        processors: dict,
+        variable: list[str] = None,
+        **kwargs) -> Callable:
+    """
+    Resolve a processor chain once and return a callable applying it.
+    Name checks and function lookups are done here, a single time: pipelines applying the same configuration to many
+    files can keep the returned callable and skip the per-file resolution that processor would redo.
+
+    Input:
+    ------
+    :param processors: dict of dict
+        Dictionary of processors names and associated keywords;
+        e.g., processors = {
+            '1--interannual_anomalies': {},
+            '2--normalize': {},
+            '3--average': {},
+        }
+        Processors or functions in current module. See each function for their required keywords
+    :param variable: variable: list[str], optional
+        List of variables in ds if it is xarray.Dataset; e.g., variable = ["ts"]
+        If ds is xarray.Dataset, variable should be provided
+        Default is None
+    **kwargs - Discarded
+
+    Output:
+    -------
+    :return: Callable
+        Function taking an xarray.DataArray or xarray.Dataset and returning it with the processors applied
+    """
+    # resolve processor names to function objects once (the dispatch dict is built at import time, see _processors)
+    steps = []
+    for k1, kwargs_processor in processors.items():
         # get processor name
         process = k1.split("--")[-1]
-        # list of processors
-        known_processors = [name for name, obj in inspect__getmembers(sys__modules[__name__])
-                            if (inspect__isfunction(obj) and name != "processor" and "__" not in name)]
         # check if it is a known processor
-        if process not in known_processors:
-            message = tools.unknown_formater("processor", process, known_processors)
+        func = _processors.get(process)
+        if func is None:
+            message = tools.unknown_formater("processor", process, sorted(_processors))
             tools.print_fail(inspect__stack(), message, fail_i=False)
             continue
-        # apply processor
-        ds = globals()[process](ds, variable=variable, **processors[k1])
-        if ds is None:
-            break
-    return ds
+        steps.append((func, kwargs_processor))
+
+    def func_chain(ds: Union[array_wrapper, dataset_wrapper]) -> Union[array_wrapper, dataset_wrapper, None]:
+        # loop on processors to apply to object
+        for func, kwargs_processor in steps:
+            ds = func(ds, variable=variable, **kwargs_processor)
+            if ds is None:
+                break
+        return ds
+    return func_chain
+
+
+def process_many(
+        filenames: list,
+        processors: dict,
+        variable: list[str] = None,
+        kwargs_netcdf_reader: dict = None,
+        **kwargs) -> list:
+    """
+    Read and process several independent files in parallel.
+    Each file runs netcdf_reader followed by the processor chain as one dask task; the files share no state, so the
+    tasks are distributed on the process scheduler (one file per worker, bypassing the GIL), like the script-level
+    parallelism of main_processing.
+
+    Input:
+    ------
+    :param filenames: list
+        Paths to dataset files, one reader call each; e.g., filenames = ["path/to/file1.nc", "path/to/file2.nc"]
+    :param processors: dict of dict
+        Dictionary of processors names and associated keywords, resolved once for all files;
+        e.g., processors = {
+            '1--interannual_anomalies': {},
+            '2--average': {},
+        }
+        Processors or functions in current module. See each function for their required keywords
+    :param variable: variable: list[str], optional
+        List of variables to read and process in each file; e.g., variable = ["ts"]
+        Default is None
+    :param kwargs_netcdf_reader: dict, optional
+        Key arguments passed to the function netcdf_reader for each file;
+        e.g., kwargs_netcdf_reader = {
+            'bounds': dict,
+            'kwargs_netcdf_open': dict,
+        }
+        Default is None
+    **kwargs - Discarded
+
+    Output:
+    -------
+    :return: list
+        Processed objects, in the order of given filenames.
+    """
+    kwargs_netcdf_reader = tools.none_to_default(kwargs_netcdf_reader, {})
+    # resolve the chain once, the compiled callable is shared by every task
+    func_chain = compile_processor(processors, variable=variable)
+
+    def func_file(filename: str) -> Union[array_wrapper, dataset_wrapper, None]:
+        return func_chain(netcdf_reader(filename=filename, variable=variable, **kwargs_netcdf_reader))
+    return list(dask__compute(*[dask__delayed(func_file)(k) for k in filenames], scheduler="processes"))
 
 
 def normalize(
@@ -535,7 +786,8 @@ def normalize(
     dim_time = xt.cf_dim_to_dim(ds, "T")
     # normalize distributions
     if tools.is_dim(dim_time) is True:
-        ds_o = ds.copy(deep=True) / ds.std(dim=dim_time, **kwargs_std)
+        # the division allocates a new object, no need to duplicate the input beforehand
+        ds_o = ds / ds.std(dim=dim_time, **kwargs_std)
         if isinstance(ds, dataset_wrapper) is True:
             # update units
             for k in xt.get_variables(ds, variable=variable):
@@ -622,6 +874,14 @@ def season_mean(
     tools.remove_keys(kwargs_get_season, keys_to_remove=["season"])
     # fake loop to be able to break out when an error occurs
     for _ in [0]:
+        # keep only the three months of the season before averaging: get_season below discards the windows centered
+        # on every other month, so computing their moving mean would touch ~4 times the needed data; the kept months
+        # stay consecutive, hence the centered windows of the central month are unchanged
+        dim_time = xt.cf_dim_to_dim(ds, "T")
+        if tools.is_dim(dim_time) is True and season in xt.season_to_central_month:
+            central_month = xt.season_to_central_month[season]
+            months = [(central_month - 2) % 12 + 1, central_month, central_month % 12 + 1]
+            ds = ds.sel({dim_time: ds[dim_time].dt.month.isin(months)})
         # moving average over 3 time steps
         ds_o = average_moving(ds, dim="T", window=3, **kwargs_average_moving)
         if ds_o is None:
@@ -685,3 +945,15 @@ def seasonal_cycle(
         ds = ds.mean(dim=dim_time, **kwargs_mean)
     return ds
 # ---------------------------------------------------------------------------------------------------------------------#
+
+
+# ---------------------------------------------------------------------------------------------------------------------#
+# Dispatch
+# ---------------------------------------------------------------------------------------------------------------------#
+# processors callable by name, resolved once at import time (all functions are defined above, no introspection is
+# needed on the hot path)
+_processors = dict(
+    (name, obj) for name, obj in list(globals().items())
+    if inspect__isfunction(obj) is True and getattr(obj, "__module__", None) == __name__ and name != "processor" and
+    "__" not in name)
+# ---------------------------------------------------------------------------------------------------------------------#
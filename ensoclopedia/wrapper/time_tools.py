@@ -8,22 +8,86 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
-from datetime import datetime as datetime__datetime
 from typing import Literal
 
 # numpy
-from numpy import integer as numpy__integer
+from numpy import arange as numpy__arange
+from numpy import array as numpy__array
+from numpy import asarray as numpy__asarray
+from numpy import float64 as numpy__float64
+from numpy import int8 as numpy__int8
+from numpy import int64 as numpy__int64
 from numpy import ndarray as numpy__ndarray
+from numpy import where as numpy__where
 from numpy import zeros as numpy__zeros
 
 # pandas
+from pandas import DatetimeIndex
 from pandas import Index
+from pandas import to_datetime as pandas__to_datetime
 # ---------------------------------------------------#
 
 
 # ---------------------------------------------------------------------------------------------------------------------#
 # Functions
 # ---------------------------------------------------------------------------------------------------------------------#
+# number of days per month (index 0 unused, month number indexes directly) for each calendar, typed once at import so
+# each call is a dict lookup returning a gather-ready buffer
+_days_per_month = dict(
+    (k1, numpy__array(k2, dtype=numpy__int8))
+    for k1, k2 in {
+        "noleap": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        "365_day": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        "standard": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        "gregorian": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        "proleptic_gregorian": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        "all_leap": [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        "366_day": [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        "360_day": [0, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30],
+    }.items())
+
+# calendars whose month lengths never depend on the year (no leap day)
+_fixed_calendars = frozenset(["noleap", "365_day", "all_leap", "366_day", "360_day"])
+
+
+def _leap_mask(years: numpy__ndarray, calendar: str = "standard") -> numpy__ndarray:
+    """
+    Vectorized counterpart of _leap_year: boolean mask of the leap years, computed branchlessly on the whole array
+    with integer bitwise operations.
+
+    Input:
+    ------
+    :param years: numpy__ndarray
+        Array of years (integer)
+    :param calendar: str
+        Name of a calendar
+
+    Output:
+    -------
+    :return: numpy__ndarray
+        Boolean array, True where the given year is a leap year
+    """
+    years = numpy__asarray(years, dtype=numpy__int64)
+    # divisible by 4 ((y & 3) == 0 is the bitwise form of y % 4 == 0)
+    div4 = (years & 3) == 0
+    if calendar == "julian":
+        mask = div4
+    elif calendar == "proleptic_gregorian":
+        mask = div4 & (~((years % 100 == 0) & (years % 400 != 0)))
+    elif calendar in ["gregorian", "standard"]:
+        # the century exception is only applied before 1583 (see _leap_year)
+        mask = div4 & (~((years % 100 == 0) & (years % 400 != 0) & (years < 1583)))
+    else:
+        mask = numpy__zeros(years.shape, dtype=bool)
+    return mask
+
+
+# days in each year of the 400-year Gregorian cycle (the leap pattern has period 400; 2000 = 0 mod 400, so the table
+# is indexed directly by year % 400)
+_days_in_year_400 = numpy__where(
+    _leap_mask(numpy__arange(400) + 2000, calendar="proleptic_gregorian"), 366, 365).astype(numpy__int64)
+
+
 def _leap_year(year: int, calendar: str = "standard") -> bool:
     """
     Determine if year is a leap year for 'gregorian', 'julian', 'proleptic_gregorian', 'standard' calendars.
@@ -43,7 +107,7 @@ def _leap_year(year: int, calendar: str = "standard") -> bool:
         True if given year is a leap year
     """
     leap = False
-    if calendar in ["gregorian", "julian", "proleptic_gregorian", "standard"] and year % 4 == 0:
+    if calendar in ["gregorian", "julian", "proleptic_gregorian", "standard"] and (year & 3) == 0:
         leap = True
         if calendar == "proleptic_gregorian" and year % 100 == 0 and year % 400 != 0:
             leap = False
@@ -82,25 +146,24 @@ def get_days_per_month(
     :return: numpy__ndarray
         Array of days per month corresponding to the time axis provided
     """
-    # create output array
-    month_length = numpy__zeros(len(time), dtype=numpy__integer)
-    # get the number of days for each month according to the calendar type
-    days_per_month = {
-        "noleap": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
-        "365_day": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
-        "standard": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
-        "gregorian": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
-        "proleptic_gregorian": [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
-        "all_leap": [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
-        "366_day": [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
-        "360_day": [0, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30],
-    }
-    nbr_of_days_for_each_month = days_per_month[calendar]
-    # number of days for each month of the given time axis
-    for k, (month, year) in enumerate(zip(time.month, time.year)):
-        month_length[k] = nbr_of_days_for_each_month[month]
-        if month == 2 and _leap_year(year, calendar=calendar):
-            month_length[k] += 1
+    # pandas computes month lengths (leap Februaries included) in compiled code; its proleptic Gregorian rules match
+    # this module's, so DatetimeIndex axes take that path directly (standard/gregorian keep the table: their century
+    # exception is only applied before 1583 here, unlike pandas')
+    if calendar == "proleptic_gregorian" and isinstance(time, DatetimeIndex) is True:
+        return time.days_in_month.values.astype(numpy__int64)
+    # get the number of days for each month according to the calendar type (table typed once at import)
+    table = _days_per_month[calendar]
+    # number of days for each month of the given time axis: a single gather through the length-13 table replaces the
+    # per-element Python loop
+    months = numpy__asarray(time.month, dtype=numpy__int64)
+    month_length = table[months].astype(numpy__int64)
+    # fixed-length calendars need no leap handling, the gather is the whole computation (the year array is not even
+    # read)
+    if calendar in _fixed_calendars:
+        return month_length
+    # add the leap day to every February of a leap year
+    years = numpy__asarray(time.year, dtype=numpy__int64)
+    month_length += (months == 2) & _leap_mask(years, calendar=calendar)
     return month_length
 
 
@@ -120,18 +183,17 @@ def get_time_plot(time: Index, **kwargs) -> numpy__ndarray:
     :return: numpy__ndarray
         Time axis based on 'year fraction'
     """
-    # create output array
-    time_o = numpy__zeros(len(time))
-    # time as year fraction
-    for k, (y, m, d, h, mi, se) in enumerate(zip(time.year, time.month, time.day, time.hour, time.minute, time.second)):
-        # create datetime for this year and the current time
-        year_start = datetime__datetime(y, 1, 1, 0, 0, 0)
-        year_end = datetime__datetime(y + 1, 1, 1, 0, 0, 0)
-        year_now = datetime__datetime(y, m, d, h, mi, se)
-        # number of seconds from the beginning of the year and total number of seconds during this year
-        sec_now = (year_now - year_start).total_seconds()
-        sec_tot = (year_end - year_start).total_seconds()
-        # time is year + second fraction
-        time_o[k] = y + sec_now / sec_tot
-    return time_o
+    # rebuild the axis from its fields in one vectorized pass (works for any input calendar, the fields are
+    # re-interpreted in the proleptic Gregorian calendar, as the per-element datetime construction did)
+    years = numpy__asarray(time.year, dtype=numpy__int64)
+    now = pandas__to_datetime({"year": years, "month": time.month, "day": time.day,
+                               "hour": time.hour, "minute": time.minute, "second": time.second}).values
+    # year boundaries as datetime64 (datetime64[Y] counts years from 1970)
+    year_start = (years - 1970).astype("datetime64[Y]").astype("datetime64[ns]")
+    # number of seconds from the beginning of the year and total number of seconds during this year (the Gregorian
+    # leap pattern repeats every 400 years, a gather through the cycle table replaces the year-end construction)
+    sec_now = (now - year_start).astype("timedelta64[s]").astype(numpy__float64)
+    sec_tot = _days_in_year_400[years % 400] * 86400.
+    # time is year + second fraction
+    return years + sec_now / sec_tot
 # ---------------------------------------------------------------------------------------------------------------------#
@@ -8,9 +8,15 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
+from pathlib import Path
+from re import compile as re__compile
 from typing import Any, Hashable, Literal, Union
-from os.path import dirname as os__path__dirname
-from os.path import join as os__path__join
+# ---------------------------------------------------#
+
+
+# ---------------------------------------------------#
+# precompiled regex matching the ' (UNITS)' placeholder or empty ' ()' units in attribute strings
+_units_regex = re__compile(r" \(UNITS\)| \(\)")
 # ---------------------------------------------------#
 
 
@@ -54,8 +60,8 @@ def default_figure_format(figure: dict) -> Literal["eps", "pdf", "png", "svg"]:
     """
     # define figure name
     figure_format = "pdf"
-    if isinstance(figure, dict) is True and "format" in list(figure.keys()) and \
-            isinstance(figure["format"], str) is True and figure["format"] in ["eps", "pdf", "png", "svg"]:
+    if isinstance(figure, dict) and "format" in figure and \
+            isinstance(figure["format"], str) and figure["format"] in ["eps", "pdf", "png", "svg"]:
         figure_format = figure["format"]
     return figure_format
 
@@ -87,15 +93,14 @@ def default_figure_name(figure: dict, filename: str) -> str:
         Path and filename for output figure
     """
     # define figure name
-    if isinstance(figure, dict) is True and "filename" in list(figure.keys()) and \
-            isinstance(figure["filename"], str) is True:
+    if isinstance(figure, dict) and "filename" in figure and \
+            isinstance(figure["filename"], str):
         figure_name = figure["filename"]
     else:
-        # directory
-        directory = "/".join(os__path__dirname(filename).split("/")[:-2]) + "/figures"
-        # file name
-        figure_name = filename.split("/")[-1].split(".")[0]
-        figure_name = os__path__join(directory, figure_name)
+        # figures directory two levels above the script, file name without extension (one parsed path, no
+        # intermediate lists, and the separator is no longer hardcoded)
+        path = Path(filename)
+        figure_name = str(path.parents[2] / "figures" / path.name.split(".")[0])
     return figure_name
 
 
@@ -140,24 +145,24 @@ def default_panel_sizes(figure: dict, figure_data: dict) -> dict[str: dict[str,
     }
     # define panel size dictionary
     panel_size = {}
-    if isinstance(figure, dict) is True and "panel_size" in list(figure.keys()) and \
-            isinstance(figure["panel_size"], dict) is True:
+    if isinstance(figure, dict) and "panel_size" in figure and \
+            isinstance(figure["panel_size"], dict):
         panel_size = figure["panel_size"]
     # add frac if needed
-    if "frac" not in list(panel_size.keys()):
+    if "frac" not in panel_size:
         panel_size["frac"] = default["frac"]
     else:
         for k1, k2 in default["frac"].items():
-            if k1 not in list(panel_size["frac"].keys()):
+            if k1 not in panel_size["frac"]:
                 put_in_dict(panel_size, k2, "frac", k1)
     # add panel if needed
     for grp in list(figure_data.keys()):
         for pan in list(figure_data[grp].keys()):
-            if pan not in list(panel_size.keys()):
+            if pan not in panel_size:
                 panel_size[pan] = default["panel"]
             else:
                 for k1, k2 in default["panel"].items():
-                    if k1 not in list(panel_size[pan].keys()):
+                    if k1 not in panel_size[pan]:
                         put_in_dict(panel_size, k2, pan, k1)
     return panel_size
 
@@ -175,7 +180,7 @@ def is_dim(dim: Any) -> bool:
     -------
     :return: bool
     """
-    return dim is not None and isinstance(dim, (Hashable, str)) is True
+    return dim is not None and isinstance(dim, (Hashable, str))
 
 
 def is_variables(variable: Any) -> bool:
@@ -192,8 +197,8 @@ def is_variables(variable: Any) -> bool:
     :return: bool
     """
     bool_o = False
-    if variable is not None and isinstance(variable, list) is True and \
-            all([isinstance(k, str) is True for k in variable]) is True:
+    if variable is not None and isinstance(variable, list) and \
+            all(isinstance(k, str) for k in variable):
         bool_o = True
     return bool_o
 
@@ -223,7 +228,7 @@ def merge_dict(dict_a: dict, dict_b: dict, name_a: str, name_b: str) -> dict:
     for dd, nn in zip([dict_a, dict_b], [name_a, name_b]):
         for ki, vv in dd.items():
             ko = ki.lower()
-            if ko in list(dict_o.keys()):
+            if ko in dict_o:
                 dict_o[ko] += ";; " + str(nn) + ") " + str(vv)
             else:
                 dict_o[ko] = str(nn) + ") " + str(vv)
@@ -274,7 +279,7 @@ def none_to_default_dict(input_value: Any, name: str, defaults: dict) -> Any:
     :return: Any
         If input_value is None, defaults[name], else input_value
     """
-    if input_value is None and isinstance(defaults, dict) is True and name in list(defaults.keys()):
+    if input_value is None and isinstance(defaults, dict) and name in defaults:
         return defaults[name]
     else:
         return input_value
@@ -293,7 +298,7 @@ def plural_s(list_i: Union[list, tuple]) -> str:
     :return: str
         's' if there are multiple values in the list else ''
     """
-    return "s" if isinstance(list_i, (list, tuple)) is True and len(list_i) > 1 else ""
+    return "s" if isinstance(list_i, (list, tuple)) and len(list_i) > 1 else ""
 
 
 def print_fail(stack_i: list, error_i: str, fail_i: bool = True):
@@ -310,11 +315,11 @@ def print_fail(stack_i: list, error_i: str, fail_i: bool = True):
         True to stop the code
     """
     if isinstance(error_i, str) and error_i != "":
-        tmp = "ERROR: file " + str(stack_i[0][1]) + " ; fct " + str(stack_i[0][3]) + " ; line " + str(stack_i[0][2])
+        tmp = f"ERROR: file {stack_i[0][1]} ; fct {stack_i[0][3]} ; line {stack_i[0][2]}"
         if fail_i is True:
-            raise ValueError(BackgroundColors.red + str(tmp) + "\n" + str(error_i) + BackgroundColors.normal)
+            raise ValueError(f"{BackgroundColors.red}{tmp}\n{error_i}{BackgroundColors.normal}")
         else:
-            print(BackgroundColors.orange + str(tmp) + "\n" + str(error_i) + BackgroundColors.normal)
+            print(f"{BackgroundColors.orange}{tmp}\n{error_i}{BackgroundColors.normal}")
 
 
 def put_in_dict(dict_i: dict, value: Any, *args):
@@ -333,14 +338,15 @@ def put_in_dict(dict_i: dict, value: Any, *args):
     """
     # put value in the dictionary
     _dict = dict_i
+    last = args[-1]
     for k in args:
-        if k == args[-1]:
-            if k in list(_dict.keys()) and isinstance(_dict[k], list) is True and isinstance(value, list) is True:
+        if k == last:
+            if k in _dict and isinstance(_dict[k], list) and isinstance(value, list):
                 _dict[k] += value
             else:
                 _dict[k] = value
         else:
-            if k not in list(_dict.keys()):
+            if k not in _dict:
                 _dict[k] = {}
             _dict = _dict[k]
 
@@ -358,12 +364,35 @@ def remove_keys(dict_i: dict, desired_keys: list[str] = None, keys_to_remove: li
     :param keys_to_remove: list[str], optional
         List of keys that should be removed if present in the input dictionary; e.g., desired_keys = ['b']
     """
-    for k in list(dict_i.keys()):
-        if (isinstance(desired_keys, list) is True and k not in desired_keys) or (
-                isinstance(keys_to_remove, list) is True and k in keys_to_remove):
+    # sets built once, so each key test is O(1) (tuple snapshot of the keys allows in-place deletion)
+    desired = set(desired_keys) if isinstance(desired_keys, list) else None
+    to_remove = set(keys_to_remove) if isinstance(keys_to_remove, list) else None
+    for k in tuple(dict_i):
+        if (desired is not None and k not in desired) or (to_remove is not None and k in to_remove):
             del dict_i[k]
 
 
+def replace_units(value: str, units: str) -> str:
+    """
+    Replace the ' (UNITS)' placeholder in given string by the units between parentheses (placeholder and empty
+    parentheses, i.e., ' ()', are removed if units is an empty string), in a single precompiled-regex pass.
+
+    Input:
+    ------
+    :param value: str
+        String in which the placeholder must be replaced; e.g., value = 'GSAT relative to 1961-1990 (UNITS)'
+    :param units: str
+        Units to insert in place of the placeholder; e.g., units = 'degC'
+
+    Output:
+    -------
+    :return: str
+        Input value with the placeholder replaced by the units (or removed if units is an empty string)
+    """
+    units_str = "" if str(units) == "" else " (" + str(units) + ")"
+    return _units_regex.sub(lambda m: units_str if m.group(0) == " (UNITS)" else "", value)
+
+
 def unknown_formater(name: str, unknown: str, known: Union[list, tuple]):
     """
     Format error/warning message when a given string is not among the defined (known).
@@ -382,7 +411,5 @@ def unknown_formater(name: str, unknown: str, known: Union[list, tuple]):
     :return: str
         Formated error/warning message
     """
-    str_o = str().ljust(5) + "unknown " + str(name) + " " + str(unknown)
-    str_o += "\n" + str().ljust(5) + str(name) + str(plural_s(known)) + ": " + ", ".join([repr(k) for k in known])
-    return str_o
+    return f"     unknown {name} {unknown}\n     {name}{plural_s(known)}: " + ", ".join(map(repr, known))
 # ---------------------------------------------------------------------------------------------------------------------#
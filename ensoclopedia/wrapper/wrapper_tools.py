@@ -19,6 +19,17 @@ from ensoclopedia.wrapper.xarray_tools import array_wrapper, dataset_wrapper
 # ---------------------------------------------------#
 
 
+# ---------------------------------------------------#
+# functions callable by name in da_execute, listed once at import instead of two dir() scans and a sort per call
+_known_dt = frozenset(k for k in dir(dt) if "__" not in k)
+_known_xt = frozenset(k for k in dir(xt) if "__" not in k)
+_known_all = sorted(_known_dt | _known_xt, key=str.lower)
+# name -> callable table resolved once (dataarray_tools takes precedence over xarray_tools, as the if/else did)
+_func_table = dict(
+    [(k, getattr(xt, k)) for k in _known_xt] + [(k, getattr(dt, k)) for k in _known_dt])
+# ---------------------------------------------------#
+
+
 # ---------------------------------------------------------------------------------------------------------------------#
 # Functions
 # ---------------------------------------------------------------------------------------------------------------------#
@@ -79,21 +90,11 @@ def da_execute(
     :return: xarray.DataArray
         Object (as input) with function applied to its data.
     """
-    # function in xarray_tools
-    known_dt = [k for k in dir(dt) if "__" not in k]
-    known_xt = [k for k in dir(xt) if "__" not in k]
-    known_all = sorted(list(set(known_dt + known_xt)), key=lambda v: v.lower())
-    da_o = None
-    # fake loop to be able to break out when an error occurs
-    for _ in [0]:
-        # check if given function is known
-        if function not in list(set(known_dt + known_xt)):
-            print_fail(inspect__stack(), unknown_formater("function", function, known_all), fail_i=False)
-            break
-        # call function
-        if function in known_dt:
-            da_o = getattr(dt, function)(da, **kwargs)
-        else:
-            da_o = getattr(xt, function)(da, **kwargs)
-    return da_o
+    # check if given function is known (table resolved once at import, see _func_table)
+    func = _func_table.get(function)
+    if func is None:
+        print_fail(inspect__stack(), unknown_formater("function", function, _known_all), fail_i=False)
+        return None
+    # call function
+    return func(da, **kwargs)
 # ---------------------------------------------------------------------------------------------------------------------#
@@ -8,13 +8,10 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
-from typing import Union
+from typing import Hashable, Union
 
 # xarray
 import xarray
-
-# local functions
-from ensoclopedia.wrapper import tools
 # ---------------------------------------------------#
 
 
@@ -24,6 +21,14 @@ from ensoclopedia.wrapper import tools
 array_wrapper = xarray.DataArray
 dataset_wrapper = xarray.Dataset
 
+# keywords accepted by each wrapped xarray function, as frozensets so the filters below are one set lookup per key
+_align_keys = frozenset(["copy", "exclude", "fill_value", "indexes", "join"])
+_apply_ufunc_keys = frozenset([
+    "dask", "dask_gufunc_kwargs", "exclude_dims", "input_core_dims", "join", "keep_attrs", "kwargs",
+    "on_missing_core_dim", "output_core_dims", "output_dtypes", "vectorize"])
+_merge_keys = frozenset(["combine_attrs", "compat", "fill_value", "join"])
+_ones_keys = frozenset(["dtype", "chunks", "chunked_array_type", "from_array_kwargs"])
+
 
 def array_align(
         *objects: tuple[Union[array_wrapper, dataset_wrapper]],
@@ -46,8 +51,62 @@ def array_align(
     :return: tuple[xarray.DataArray or xarray.Dataset]
         Tuple of objects with the same type as *objects with aligned coordinates.
     """
-    tools.remove_keys(kwargs, desired_keys=["copy", "exclude", "fill_value", "indexes", "join"])
-    return xarray.align(*objects, **kwargs)
+    return xarray.align(*objects, **dict((k1, k2) for k1, k2 in kwargs.items() if k1 in _align_keys))
+
+
+def array_apply_ufunc(
+        func,
+        *args: Union[array_wrapper, dataset_wrapper],
+        **kwargs) -> Union[array_wrapper, dataset_wrapper]:
+    """
+    Apply a vectorized function for unlabeled arrays on xarray objects. With dask='parallelized', the function is
+    evaluated chunk by chunk so dask-backed inputs are never materialized in one piece.
+    https://docs.xarray.dev/en/stable/generated/xarray.apply_ufunc.html
+
+    Input:
+    ------
+    :param func: callable
+        Function to call, expecting and returning numpy.ndarray-like objects
+    :param args: xarray.DataArray or xarray.Dataset
+        Objects passed to func
+    :param kwargs: dict
+        Key arguments passed to xarray apply_ufunc (see url above)
+
+    Output:
+    -------
+    :return: xarray.DataArray or xarray.Dataset
+        Object (as input) with func applied to its (possibly chunked) data.
+    """
+    return xarray.apply_ufunc(func, *args, **dict((k1, k2) for k1, k2 in kwargs.items() if k1 in _apply_ufunc_keys))
+
+
+def array_dot(
+        da_a: array_wrapper,
+        da_b: array_wrapper,
+        dim: Union[Hashable, str] = None,
+        **kwargs) -> array_wrapper:
+    """
+    Compute the dot product of two DataArrays along given dimension (sum of the elementwise products), dispatched to
+    BLAS matmul by numpy.
+    https://docs.xarray.dev/en/stable/generated/xarray.dot.html
+
+    Input:
+    ------
+    :param da_a: xarray.DataArray
+        First array of the product
+    :param da_b: xarray.DataArray
+        Second array of the product
+    :param dim: Hashable or str, optional
+        Dimension along which to contract the product; e.g., dim = "T"
+        Default is None (all shared dimensions are contracted)
+    **kwargs - Discarded
+
+    Output:
+    -------
+    :return: xarray.DataArray
+        New DataArray with the dot product of both inputs and the contracted dimension removed.
+    """
+    return xarray.dot(da_a, da_b, dim=dim)
 
 
 def array_ones(
@@ -69,8 +128,7 @@ def array_ones(
     :return: xarray.DataArray or xarray.Dataset
         New object of ones with the same shape and type as ds.
     """
-    tools.remove_keys(kwargs, desired_keys=["dtype", "chunks", "chunked_array_type", "from_array_kwargs"])
-    return xarray.ones_like(ds, **kwargs)
+    return xarray.ones_like(ds, **dict((k1, k2) for k1, k2 in kwargs.items() if k1 in _ones_keys))
 
 
 def merge(objects, **kwargs) -> dataset_wrapper:
@@ -90,8 +148,7 @@ def merge(objects, **kwargs) -> dataset_wrapper:
     :return: xarray.Dataset
         New Dataset with combined variables from each object.
     """
-    tools.remove_keys(kwargs, desired_keys=["combine_attrs", "compat", "fill_value", "join"])
-    return xarray.merge(objects, **kwargs)
+    return xarray.merge(objects, **dict((k1, k2) for k1, k2 in kwargs.items() if k1 in _merge_keys))
 
 
 def polynomial_fit(
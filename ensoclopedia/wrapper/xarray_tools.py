@@ -8,14 +8,16 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
-from copy import deepcopy as copy__deepcopy
+from functools import lru_cache as functools__lru_cache
 from inspect import stack as inspect__stack
-from re import split as re__split
 from typing import Literal, Union, Hashable
 
 # numpy
-from numpy import array as numpy__array
+from numpy import asarray as numpy__asarray
+from numpy import datetime64 as numpy__datetime64
+from numpy import flatnonzero as numpy__flatnonzero
 from numpy import ndarray as numpy__ndarray
+from numpy import searchsorted as numpy__searchsorted
 
 # xarray
 import xarray
@@ -30,21 +32,44 @@ from ensoclopedia.wrapper.xarray_base import array_wrapper, dataset_wrapper
 # ---------------------------------------------------------------------------------------------------------------------#
 # Functions
 # ---------------------------------------------------------------------------------------------------------------------#
-def _split_time_bound(time_bound: str) -> list[str]:
-    """
-    Split string by multiple delimiter patterns: '-', ' ' or ':'.
-
-    Input:
-    ------
-    :param time_bound: str
-        Any string but usually a time bound, e.g., time_bound = '1980-01-15 12:00:00.0'
-
-    Output:
-    -------
-    :return: list[str]
-        List of string corresponding to input time_bound split at each '-', ' ' or ':'
-    """
-    return re__split("-| |:", time_bound)
+# central month of each 3-month season (e.g., NDJ is centered on December)
+season_to_central_month = {
+    "DJF": 1, "JFM": 2, "FMA": 3, "MAM": 4, "AMJ": 5, "MJJ": 6, "JJA": 7, "JAS": 8, "ASO": 9, "SON": 10, "OND": 11,
+    "NDJ": 12,
+}
+
+
+# standard name given to each CF dimension when files are opened
+_cf_to_standard_dim = {"T": "time", "X": "longitude", "Y": "latitude"}
+
+# names tried for each CF dimension, in preference order
+_dim_to_find = {
+    "T": ["time", "tim"],
+    "X": ["longitude", "lon", "x"],
+    "Y": ["latitude", "lat", "y"],
+}
+
+
+@functools__lru_cache(maxsize=1024)
+def _resolve_cf_dim(list_dim: tuple, cf_dim: str) -> Union[Hashable, str, None]:
+    # resolution only depends on the coordinate names, so it is memoized on them: the same dataset (or any dataset
+    # with the same coordinates) resolves each CF dimension once per process
+    candidates = _dim_to_find[cf_dim]
+    set_dim = set(list_dim)
+    # exact name matches first (set membership, no substring scan)
+    for k1 in candidates:
+        if k1 in set_dim:
+            return k1
+    # no exact match -> check if a candidate is included in a dimension name
+    for k1 in candidates:
+        for k2 in list_dim:
+            # if k1 is a single letter it must be the first letter k2 (dimension name)
+            #     e.g., k1 = 'x', if k2 = 'xt_ocean' or 'x_dim', k2 is probably the dimension we are looking for
+            # otherwise, k1 must be included in k2 (dimension name)
+            #     e.g., k1 = 'lon', if k2 = 'dim_lon' or 'dim_lon', k2 is probably the dimension we are looking for
+            if (len(k1) == 1 and k2[:1] == k1) or (len(k1) > 1 and k1 in k2):
+                return k2
+    return None
 
 
 def cf_dim_to_dim(
@@ -66,34 +91,7 @@ def cf_dim_to_dim(
     :return: Hashable or str or None
         Name of given CF dimension in input xarray.DataArray or xarray.Dataset.
     """
-    # list dimension
-    list_dim = list(ds.coords)
-    # dimension to find
-    dim_to_find = {
-        "T": ["time", "tim"],
-        "X": ["longitude", "lon", "x"],
-        "Y": ["latitude", "lat", "y"],
-    }
-    # find the name in the dataset
-    dim_o = None
-    for k1 in dim_to_find[cf_dim]:
-        if k1 in list_dim:
-            # k1 is a dimension name in ds
-            dim_o = copy__deepcopy(k1)
-            break
-        else:
-            # k1 is not an exact match -> check if k1 is included in a dimension name
-            for k2 in list_dim:
-                # if k1 is a single letter it must be the first letter k2 (dimension name)
-                #     e.g., k1 = 'x', if k2 = 'xt_ocean' or 'x_dim', k2 is probably the dimension we are looking for
-                # otherwise, k1 must be included in k2 (dimension name)
-                #     e.g., k1 = 'lon', if k2 = 'dim_lon' or 'dim_lon', k2 is probably the dimension we are looking for
-                if (len(k1) == 1 and k2[:1] == k1) or (len(k1) > 1 and k1 in k2):
-                    dim_o = copy__deepcopy(k2)
-                    break
-        if tools.is_dim(dim_o) is True:
-            break
-    return dim_o
+    return _resolve_cf_dim(tuple(ds.coords), cf_dim)
 
 
 def check_dim(
@@ -119,7 +117,7 @@ def check_dim(
     if dim is None or isinstance(dim, (Hashable, str)) is False:
         pass
     elif dim in ds.dims:
-        dim_o = copy__deepcopy(dim)
+        dim_o = dim
     elif dim in ["T", "X", "Y"]:
         dim_o = cf_dim_to_dim(ds, dim)
     if dim_o is None or isinstance(dim_o, (Hashable, str)) is False:
@@ -187,31 +185,23 @@ def check_time_bounds(
     tools.remove_keys(kwargs_isel, desired_keys=["drop", "missing"])
     # get time dimension
     dim_time = cf_dim_to_dim(ds, "T")
-    # fake loop to be able to break out when an error occurs
-    l0 = [0] if isinstance(dim_time, str) is True else []
-    for _ in l0:
-        # bound position (0 or 1)
-        position = 0 if side == "lower" else 1
-        # split time bound in ["year", "month", "day"]
-        tb = get_time_bounds(ds)
-        if tb is None:
-            break
-        split_ta = _split_time_bound(tb[position])
-        split_td = _split_time_bound(time_bounds[position])
-        while (side == "lower" and all([float(k1) >= float(k2) for k1, k2 in zip(split_ta, split_td)]) is False) or \
-                (side == "upper" and all([float(k1) <= float(k2) for k1, k2 in zip(split_ta, split_td)]) is False):
-            # if side == "lower" & one of available("year", "month", "day") is smaller than desired
-            # ("year", "month", "day")
-            # or
-            # if side == "upper" & one of available("year", "month", "day") is larger than desired
-            # ("year", "month", "day")
-            # remove the first (last) time step
-            time_slice = slice(1, int(1e20)) if side == "lower" else slice(0, -1)
-            ds = ds.isel(indexers={dim_time: time_slice}, **kwargs_isel)
-            tb = get_time_bounds(ds)
-            if tb is None:
-                break
-            split_ta = _split_time_bound(str(tb[position]))
+    if isinstance(dim_time, str) is True:
+        # desired bound at day resolution
+        target = numpy__datetime64(time_bounds[0 if side == "lower" else 1], "D")
+        # the whole time axis is read once at day resolution and binary-searched: one isel with a slice replaces
+        # the step-by-step peeling (which re-read the first/last time value at every iteration), and datetime64
+        # comparison is a true date ordering, not a field-by-field one
+        times = ds[dim_time].values.astype("datetime64[D]")
+        if side == "lower":
+            # first index at or after the desired lower bound
+            index = int(numpy__searchsorted(times, target, side="left"))
+            if index > 0:
+                ds = ds.isel(indexers={dim_time: slice(index, None)}, **kwargs_isel)
+        else:
+            # first index after the desired upper bound
+            index = int(numpy__searchsorted(times, target, side="right"))
+            if index < len(times):
+                ds = ds.isel(indexers={dim_time: slice(0, index)}, **kwargs_isel)
     return ds
 
 
@@ -238,19 +228,18 @@ def constant_mask(
     # constant mask along the time dimension
     if isinstance(dim_time, str) is True:
         if isinstance(ds, array_wrapper) is True:
-            # sum mask through time
-            mask = ds.isnull().astype('f').sum(dim=dim_time)
+            # OR-reduce mask through time: boolean 'any' short-circuits and skips the float cast of a sum
+            mask = ds.isnull().any(dim=dim_time)
             # mask input data where at least one value is masked
-            ds = ds.where(mask == 0)
+            ds = ds.where(~mask)
         else:
-            # loop on each data_var of the dataset
-            for data_var in list(ds.keys()):
-                if "_bounds" in data_var or "_bnds" in data_var:
-                    continue
-                # sum mask through time
-                mask = ds[data_var].isnull().astype('f').sum(dim=dim_time)
-                # mask input data where at least one value is masked
-                ds[data_var] = ds[data_var].where(mask == 0)
+            # mask all data_vars at once (bounds variables excluded): on dask-backed data the per-variable
+            # reductions then run as one graph instead of one scheduler pass per variable
+            data_vars = [k for k in ds.keys() if "_bounds" not in k and "_bnds" not in k]
+            if len(data_vars) > 0:
+                sub = ds[data_vars]
+                # OR-reduce mask through time: boolean 'any' short-circuits and skips the float cast of a sum
+                ds.update(sub.where(~sub.isnull().any(dim=dim_time)))
     return ds
 
 
@@ -274,10 +263,7 @@ def get_season(
         Name of a season
         Default is 'NDJ'
     :param kwargs_groupby: dict, optional
-        Key arguments passed to xarray groupby (see url above);
-        e.g., kwargs_groupby = {
-            'restore_coord_dims': bool,
-        }
+        Kept for backward compatibility and discarded (the season's months are selected directly, without groupby)
         Default is None
     :param kwargs_isel: dict, optional
         Key arguments for xarray isel (see url above);
@@ -295,30 +281,23 @@ def get_season(
     """
     kwargs_isel = tools.none_to_default(kwargs_isel, {})
     tools.remove_keys(kwargs_isel, desired_keys=["drop", "missing_dims"])
-    kwargs_groupby = tools.none_to_default(kwargs_groupby, {})
-    tools.remove_keys(kwargs_isel, desired_keys=["restore_coord_dims"])
     ds_o = None
-    centered_month_per_season = {
-        "DJF": 1, "JFM": 2, "FMA": 3, "MAM": 4, "AMJ": 5, "MJJ": 6, "JJA": 7, "JAS": 8, "ASO": 9, "SON": 10, "OND": 11,
-        "NDJ": 12,
-    }
     # time dimension name
     dim_time = cf_dim_to_dim(ds, "T")
     if dim_time is not None and isinstance(dim_time, (Hashable, str)) is True:
-        # Use .groupby('time.month') to organize the data into months
-        # then use .groups to extract the indices for each month
-        month_idxs = ds.groupby(group=str(dim_time) + ".month", **kwargs_groupby).groups
-        # Extract the time indices corresponding to all 'season'
-        idx = month_idxs[centered_month_per_season[season]]
+        # indices of the season's central month: one vectorized compare on the month numbers instead of building
+        # the full 12-month groupby index dict
+        months = ds[dim_time].dt.month.values
+        idx = numpy__flatnonzero(months == season_to_central_month[season])
         # Extract the 'season' months by selecting the relevant indices
         ds_o = ds.isel(indexers={dim_time: idx}, **kwargs_isel)
-        # get time index
-        time_ind = ds_o[dim_time].to_index()
-        years = time_ind.year
+        # get the years as an int64 array straight from the index (no Python-int round-trip through a list);
+        # asarray handles both DatetimeIndex (whose .year is an Index) and CFTimeIndex (whose .year is an ndarray)
+        years = numpy__asarray(ds_o[dim_time].to_index().year, dtype="int64")
         if season == "DJF":
-            years += 1
+            years = years + 1
         # change dimension
-        ds_o = ds_o.assign_coords({dim_time: numpy__array(list(years))})
+        ds_o = ds_o.assign_coords({dim_time: years})
         ds_o = ds_o.rename({dim_time: "year"})
         # remove first or last time step depending on the case
         # rolling computes the first time step as DJF and last time step as NDJ, fills them with nans
@@ -376,12 +355,35 @@ def get_variables(
     list_variables = None
     if isinstance(ds, dataset_wrapper) is True:
         if tools.is_variables(variable) is True:
-            list_variables = copy__deepcopy(variable)
+            list_variables = list(variable)
         else:
-            list_variables = [k for k in list(ds.keys()) if "bound" not in k and "bnd" not in k]
+            # iterate the data_vars mapping directly, no intermediate key list
+            list_variables = [k for k in ds.data_vars if "bound" not in k and "bnd" not in k]
     return list_variables
 
 
+def _mask_hadisst(ds: dataset_wrapper) -> dataset_wrapper:
+    """
+    Mask the -1000 values used by HadISST for missing data.
+    Passed as 'preprocess' to xarray.open_mfdataset so each file is masked lazily (per chunk) before concatenation,
+    instead of masking the whole concatenated dataset afterward.
+
+    Input:
+    ------
+    :param ds: xarray.Dataset
+        Dataset read from a single HadISST file
+
+    Output:
+    -------
+    :return: xarray.Dataset
+        Input dataset with -1000 values masked in float variables
+    """
+    for k in list(ds.keys()):
+        if ds[k].dtype.kind == "f":
+            ds[k] = ds[k].where(ds[k] != -1000.)
+    return ds
+
+
 def netcdf_open(
         filename: Union[str, list[str]],
         variable: Union[str, list[str], None],
@@ -436,26 +438,25 @@ def netcdf_open(
     """
     kwargs_open_mfdataset = tools.none_to_default(kwargs_open_mfdataset, {})
     if tools.is_variables(variable) is True:
-        kwargs_open_mfdataset["data_vars"] = copy__deepcopy(variable)
+        kwargs_open_mfdataset["data_vars"] = list(variable)
+    # HadISST has -1000 values... -> mask them per file at open time (lazily, per chunk)
+    if "hadisst" in str(filename).lower() and "preprocess" not in kwargs_open_mfdataset:
+        kwargs_open_mfdataset["preprocess"] = _mask_hadisst
     # create dataset
     ds = xarray.open_mfdataset(filename, **kwargs_open_mfdataset)
-    if variable is not None and isinstance(variable, list) is True and \
-            all([isinstance(k, str) is True for k in variable]) is True:
-        for k in list(ds.keys()):
-            if k not in variable:
-                del ds[k]
-    # update time, lat, lon dimensions
-    dict_dim = {"T": "time", "X": "longitude", "Y": "latitude"}
+    if tools.is_variables(variable) is True:
+        # select the desired variables in one operation instead of deleting the others one by one
+        ds = ds[[k for k in variable if k in ds.data_vars]]
+    # update time, lat, lon dimensions (name mapping built once at module level)
     new_dims = {}
-    for k in ["T", "X", "Y"]:
-        dim = cf_dim_to_dim(ds, k)
-        if tools.is_dim(dim) is True and dim != dict_dim[k]:
-            new_dims[dim] = dict_dim[k]
-    if len(list(new_dims.keys())) > 0:
-        ds_o = {}
-        for k in list(ds.keys()):
-            ds_o[k] = ds[k].rename(new_name_or_name_dict=new_dims)
-        ds = dataset_wrapper(data_vars=ds_o, attrs=ds.attrs)
+    for k1, k2 in _cf_to_standard_dim.items():
+        dim = cf_dim_to_dim(ds, k1)
+        if tools.is_dim(dim) is True and dim != k2:
+            new_dims[dim] = k2
+    if len(new_dims) > 0:
+        # a single dataset-level rename updates every variable and coordinate in one graph operation (and keeps
+        # dataset attrs, encoding and dask laziness, unlike a per-variable rebuild)
+        ds = ds.rename(new_dims)
     # update longitude
     dim_lon = cf_dim_to_dim(ds, "X")
     if tools.is_dim(dim_lon) is True:
@@ -466,9 +467,6 @@ def netcdf_open(
     if tools.is_dim(dim_lat) is True and len(ds[dim_lat].shape) == 1:
         # ensure that latitude ranges from -90 to 90N
         ds = ds.sortby(dim_lat)
-    # HadISST has -1000 values... -> mask them
-    if "hadisst" in filename.lower():
-        ds = ds.where(ds != -1000.)
     return ds
 
 
@@ -536,8 +534,9 @@ def recreate_array(
             dim = cf_dim_to_dim(da, k1)
             if tools.is_dim(dim):
                 coordinates[dim] = da[dim]
-                for k2 in list(da[dim].dims):
-                    if k2 in list(coordinates.keys()):
+                # dict membership is O(1), no need to rebuild a key list per dimension
+                for k2 in da[dim].dims:
+                    if k2 in coordinates:
                         del coordinates[k2]
     # add given dimension(s)
     if isinstance(axis_added, (list, tuple)) is True and isinstance(dim_added, (list, tuple)) is True and \
@@ -546,7 +545,7 @@ def recreate_array(
             # add given dimension at given position
             dimensions.insert(k1, k2)
             # add coordinates in dictionary
-            if isinstance(coords_added, dict) is True and k2 in coords_added.keys():
+            if isinstance(coords_added, dict) is True and k2 in coords_added:
                 coordinates[k2] = coords_added[k2]
             else:
                 coordinates[k2] = array_wrapper(list(range(arr.shape[k1])))
@@ -554,12 +553,13 @@ def recreate_array(
     attributes = da.attrs
     # remove attributes
     for k in attrs_removed:
-        if k in list(attributes.keys()):
+        if k in attributes:
             del attributes[k]
     # add given attribute(s)
     if isinstance(attrs_added, dict) is True:
         attributes.update(attrs_added)
-    attributes = dict((k, attributes[k]) for k in sorted(list(attributes.keys()), key=lambda v: v.lower()))
+    # sort items directly: no intermediate key list and no per-key lookup to rebuild the dict afterward
+    attributes = dict(sorted(attributes.items(), key=lambda kv: kv[0].lower()))
     # numpy.ndarray to xarray.DataArray
     return array_wrapper(attrs=attributes, coords=coordinates, data=arr, dims=dimensions)
 
@@ -577,25 +577,21 @@ def remove_unused_coordinates(ds: Union[array_wrapper, dataset_wrapper]) -> Unio
     :return: xarray.DataArray or xarray.Dataset
         Object (as input) with unused coordinates removed
     """
-    # dimensions in object
-    dims_in_ds = list(ds.coords)
-    # dimensions used in object
-    dims_used = []
+    # dimensions used in object (single set union instead of growing a list variable by variable)
     if isinstance(ds, array_wrapper) is True:
-        dims_used = list(ds.dims)
+        dims_used = set(ds.dims)
     else:
-        # loop on each data_var of the dataset
-        for data_var in list(ds):
-            dims_used += list(ds[data_var].dims)
+        dims_used = set().union(*(ds[data_var].dims for data_var in ds.data_vars)) if len(ds.data_vars) > 0 else set()
     # check multidimensional coordinates
     if check_multidimensional_coordinates(ds) is True:
         for k in ["X", "Y"]:
             dim = cf_dim_to_dim(ds, k)
             if tools.is_dim(dim) is True:
-                dims_used.append(dim)
-    # remove unused coordinates
-    for k in list(set(dims_in_ds) - set(dims_used)):
-        del ds[k]
+                dims_used.add(dim)
+    # remove unused coordinates in one operation (each del rebuilds the indexes)
+    unused = set(ds.coords) - dims_used
+    if len(unused) > 0:
+        ds = ds.drop_vars(unused)
     return ds
 
 
@@ -621,27 +617,26 @@ def roll_longitude(
     """
     dim_lon = cf_dim_to_dim(ds, "X")
     if tools.is_dim(dim_lon) is True:
-        # update longitude
+        # update longitude, computed once at numpy level (one C pass over the array)
         if isinstance(new_lon_min, (float, int)) is True:
             # add minimum value to dataset's longitude to shift the dimension
             # e.g., initial longitude = [0; 360], new_lon_min = -70, new longitude = [-70; 290]
-            ds = ds.assign_coords({dim_lon: ds[dim_lon] + new_lon_min})
+            lon = ds[dim_lon].values + new_lon_min
         else:
-            # ensure that longitude ranges from 0 to 360E
-            ds = ds.assign_coords({dim_lon: (360 + (ds[dim_lon] % 360)) % 360})
-        # roll so that the first longitude of the dimension is the minimum longitude
-        if check_multidimensional_coordinates(ds) is False:
-            # normal roll method
-            ds = ds.roll({dim_lon: -ds[dim_lon].argmin().values}, roll_coords=True)
+            # ensure that longitude ranges from 0 to 360E (numpy's % is already non-negative for a positive divisor)
+            lon = ds[dim_lon].values % 360
+        ds = ds.assign_coords({dim_lon: (ds[dim_lon].dims, lon)})
+        # roll so that the first longitude of the dimension is the minimum longitude (the longitude array's ndim tells
+        # directly whether the grid is curvilinear, no need to resolve both X and Y again)
+        if lon.ndim == 1:
+            # normal roll method (argmin taken on the ndarray, no xarray scalar wrapping)
+            ds = ds.roll({dim_lon: -int(lon.argmin())}, roll_coords=True)
         else:
             # for multidimensional coordinates (e.g., curvilinear grids)
-            # average lon along Y
-            arr_lon = ds[dim_lon]
-            lon_x = arr_lon.to_numpy().mean(axis=0)
-            # find minimum value
-            min_x = lon_x.argmin()
+            # average lon along Y and find minimum value
+            lon_x = lon.mean(axis=0)
             # roll
-            ds = ds.roll({arr_lon.dims[-1]: -min_x}, roll_coords=True)
+            ds = ds.roll({ds[dim_lon].dims[-1]: -int(lon_x.argmin())}, roll_coords=True)
     return ds
 
 
@@ -669,12 +664,16 @@ def set_dim_as_first(
     # get dimension name
     dim_name = check_dim(ds, dim)
     if dim_name is not None:
-        if (isinstance(ds, dataset_wrapper) is True and len(list(ds.coords)) == 1) or (
-                isinstance(ds, array_wrapper) is True and (list(ds.dims)[0] == dim_name or len(list(ds.dims)) == 1)):
+        # skip the transpose when every variable already has dim_name first (transpose would be a no-op but still
+        # rebuilds the object and re-wraps the dask graphs)
+        if (isinstance(ds, dataset_wrapper) is True and (
+                len(ds.coords) == 1 or
+                all(dim_name not in ds[k].dims or ds[k].dims[0] == dim_name for k in ds.data_vars))) or (
+                isinstance(ds, array_wrapper) is True and (ds.dims[0] == dim_name or len(ds.dims) == 1)):
             return ds
         else:
-            # set dim as the first dimension of ds
-            return ds.transpose(dim_name, "...")
+            # set dim as the first dimension of ds (... is the Ellipsis object, not a string)
+            return ds.transpose(dim_name, ...)
     else:
         return None
 
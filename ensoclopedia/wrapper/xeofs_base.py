@@ -8,9 +8,23 @@
 # Import packages
 # ---------------------------------------------------#
 # basic python package
-from copy import deepcopy as copy__deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Union, Hashable
 
+# dask
+from dask.base import tokenize as dask__tokenize
+
+# numpy
+from numpy import atleast_1d as numpy__atleast_1d
+from numpy import cos as numpy__cos
+from numpy import deg2rad as numpy__deg2rad
+from numpy import ndarray as numpy__ndarray
+from numpy import sqrt as numpy__sqrt
+
+# xarray
+from xarray import open_dataarray as xarray__open_dataarray
+
 # xeofs
 import xeofs
 
@@ -44,20 +58,39 @@ def eofs(
         None is returned if input dim is CF dim and wasn't found
     """
     # find dimension name if CF dim
-    dim = cf_dim_to_dim(ds, dim) if dim in ["T", "X", "Y"] else copy__deepcopy(dim)
+    dim = cf_dim_to_dim(ds, dim) if dim in ["T", "X", "Y"] else dim
     # compute EOF eigenvectors along given dimension
     ds_o = None
-    if isinstance(dim, (Hashable, str)) is True:
+    if isinstance(dim, (Hashable, str)):
+        # precompute the coslat weights once on the shared latitude grid and pass them explicitly, instead of
+        # letting xeofs rebuild them inside every fit (bit-identical to use_coslat=True)
+        kwargs_xeofs = kwargs.get("kwargs_xeofs") if isinstance(kwargs.get("kwargs_xeofs"), dict) else {}
+        kwargs_fit = kwargs.get("kwargs_fit") if isinstance(kwargs.get("kwargs_fit"), dict) else {}
+        dim_lat = cf_dim_to_dim(ds, "Y")
+        if kwargs_xeofs.get("use_coslat", True) is True and "weights" not in kwargs_fit and \
+                dim_lat is not None and ds[dim_lat].ndim == 1:
+            weights = numpy__sqrt(numpy__cos(numpy__deg2rad(ds[dim_lat])))
+            kwargs = dict(kwargs)
+            kwargs["kwargs_xeofs"] = {**kwargs_xeofs, "use_coslat": False}
+            kwargs["kwargs_fit"] = {**kwargs_fit, "weights": weights}
         # compute eofs
-        if isinstance(ds, array_wrapper) is True:
+        if isinstance(ds, array_wrapper):
             ds_o = eofs_compute(ds, dim, **kwargs)
         else:
-            # loop on each data_var of the dataset
-            ds_o = {}
-            for data_var in list(ds.keys()):
-                if "_bounds" in data_var or "_bnds" in data_var:
-                    continue
-                ds_o[data_var] = eofs_compute(ds[data_var], dim, **kwargs)
+            # each data_var is an independent fit, so they are dispatched on a thread pool (the SVD runs in
+            # BLAS/LAPACK, which releases the GIL, so the fits genuinely overlap)
+            # bounds variables: CF names them through the 'bounds' attribute (computed once, one set lookup per
+            # var); the usual *_bounds/*_bnds naming is kept as a fallback for files without the attribute
+            bounds_vars = set(ds[k].attrs.get("bounds") for k in ds.variables) - {None}
+            data_vars = [
+                k for k in ds.data_vars
+                if k not in bounds_vars and "_bounds" not in k and "_bnds" not in k]
+            if len(data_vars) > 1:
+                with ThreadPoolExecutor(max_workers=len(data_vars)) as executor:
+                    futures = dict((k, executor.submit(eofs_compute, ds[k], dim, **kwargs)) for k in data_vars)
+                    ds_o = dict((k1, k2.result()) for k1, k2 in futures.items())
+            else:
+                ds_o = dict((k, eofs_compute(ds[k], dim, **kwargs)) for k in data_vars)
             # convert to dataset
             ds_o = dataset_wrapper(data_vars=ds_o, attrs=ds.attrs)
     return ds_o
@@ -66,6 +99,8 @@ def eofs(
 def eofs_compute(
         da: array_wrapper,
         dim: Union[Hashable, str] = None,
+        cache: Union[bool, str] = False,
+        working_dtype: Union[str, None] = "float32",
         kwargs_fit: dict = None,
         kwargs_std: dict = None,
         kwargs_xeofs: dict = None,
@@ -81,6 +116,17 @@ def eofs_compute(
     :param dim: Hashable or str
         Name of dimension along which to apply EOF; e.g., dim = "time"
         This must be a dimension in da (i.e., cannot be a CD dimension)
+    :param cache: bool or str, optional
+        True to store the result on disk (under ~/.cache/ensoclopedia) keyed on a hash of the input data and key
+        arguments, or a directory to store it elsewhere; repeated calls with unchanged inputs read the stored file
+        instead of redoing the decomposition
+        Default is False (no cache)
+    :param working_dtype: str or None, optional
+        Float dtype used for the decomposition; e.g., working_dtype = "float32"
+        EOF patterns of climate anomalies do not need double precision, and single precision halves the memory
+        traffic while the single-precision LAPACK kernels run about twice as fast (the output is cast back to the
+        input dtype); use None to decompose in the input dtype
+        Default is "float32"
     :param kwargs_fit: dict, optional
         Key arguments passed to the function xeofs.single.EOF.fit (see url above)
         Default is None
@@ -98,17 +144,44 @@ def eofs_compute(
         New object as input with EOF eigenvectors computed along the specified dimension
     """
     # set key arguments dictionary to instance of dictionary if the wrong instance was given
-    if isinstance(kwargs_xeofs, dict) is False:
-        kwargs_xeofs = {}
-    if isinstance(kwargs_fit, dict) is False:
-        kwargs_fit = {}
-    if isinstance(kwargs_std, dict) is False:
-        kwargs_std = {}
-    # set some default values to kwargs_xeofs
-    default = {"n_modes": 1, "use_coslat": True}
+    kwargs_xeofs = kwargs_xeofs if isinstance(kwargs_xeofs, dict) else {}
+    kwargs_fit = kwargs_fit if isinstance(kwargs_fit, dict) else {}
+    kwargs_std = kwargs_std if isinstance(kwargs_std, dict) else {}
+    # set some default values to kwargs_xeofs (randomized truncated SVD: only n_modes modes are needed, no reason to
+    # pay for the full decomposition of the space x time matrix)
+    default = {"n_modes": 1, "use_coslat": True, "solver": "randomized"}
     for k1, k2 in default.items():
-        if k1 not in list(kwargs_xeofs.keys()):
-            kwargs_xeofs[k1] = copy__deepcopy(k2)
+        kwargs_xeofs.setdefault(k1, k2)
+    if kwargs_xeofs["solver"] == "randomized":
+        # random_state pins the sketch so repeated runs give identical modes (xeofs only honors the seed as a
+        # top-level argument); other solver settings are left to the backend defaults, as the numpy and dask
+        # backends do not accept the same solver_kwargs
+        kwargs_xeofs.setdefault("random_state", 0)
+    # decompose in working_dtype (float32 by default, see docstring); the cast happens before the cache key is
+    # computed so float64 and float32 copies of the same field share a cache entry
+    dtype_i = da.dtype
+    if working_dtype is not None and da.dtype.kind == "f" and str(da.dtype) != working_dtype:
+        da = da.astype(working_dtype, copy=False)
+    # optional persistent cache: the fit is deterministic given (data, dim, key arguments), so repeated runs
+    # (typical while iterating on figures) read the stored result instead of redoing the decomposition
+    cache_file = None
+    if cache is not False:
+        cache_dir = Path(cache) if isinstance(cache, str) else Path.home() / ".cache" / "ensoclopedia"
+        cache_file = cache_dir / ("eofs_" + dask__tokenize(da, dim, kwargs_fit, kwargs_std, kwargs_xeofs) + ".nc")
+        if cache_file.exists():
+            da_o = xarray__open_dataarray(cache_file).load()
+            if "explained_variance" in da_o.attrs:
+                # netCDF stores the list as an array (a scalar when there is a single mode), restore the in-memory
+                # form
+                da_o.attrs["explained_variance"] = [
+                    float(k) for k in numpy__atleast_1d(da_o.attrs["explained_variance"])]
+            return da_o
+    # put the sample dimension first so the reductions inside the solver run with unit stride, and keep it in a
+    # single chunk for dask-backed arrays (the truncated SVD needs the whole sample dimension per chunk anyway)
+    if da.dims[0] != dim:
+        da = da.transpose(dim, ...)
+    if da.chunks is not None:
+        da = da.chunk({dim: -1})
     # generate EOF object
     eof_object = xeofs.single.EOF(**kwargs_xeofs)
     # fit EOF object to given DataArray
@@ -116,16 +189,33 @@ def eofs_compute(
     # compute eigenvectors (components), PCs (scores) and explained variance
     components = fit.components()
     scores = fit.scores()
-    explained_variance = fit.explained_variance_ratio().values * 100
-    explained_variance = [float(k) for k in explained_variance]
-    # compute scores' std along given dimension
-    scores_std = scores.std(dim=dim, **kwargs_std)
-    # multiply components by scores std (to have components as input units)
+    # tolist is a single C call that already yields Python floats, no per-element float() loop
+    explained_variance = (fit.explained_variance_ratio().values * 100.).tolist()
+    # compute scores' std along given dimension; the PCs are centered, so std(PC_k) = s_k / sqrt(N - ddof) with s_k
+    # the stored singular values: the analytic form skips a full pass over the PC time series (any kwargs_std beyond
+    # ddof falls back to the empirical reduction)
+    if len(set(kwargs_std) - {"ddof"}) == 0:
+        scores_std = fit.singular_values() / (scores.sizes[dim] - kwargs_std.get("ddof", 0)) ** 0.5
+    else:
+        scores_std = scores.std(dim=dim, **kwargs_std)
+    # multiply components by scores std (to have components as input units), back in the input dtype
     da_o = components * scores_std
+    if da_o.dtype != dtype_i and dtype_i.kind == "f":
+        da_o = da_o.astype(dtype_i, copy=False)
+    # input variable attrs on new array (xeofs' own attrs take precedence), then the explained variance
+    da_o.attrs = {**da.attrs, **da_o.attrs}
     da_o.attrs.update({"explained_variance": explained_variance})
-    # input dimension attrs on new array
-    for dim in da.dims:
-        if dim in da_o.dims:
-            da_o[dim].attrs.update(da[dim].attrs)
+    # input dimension attrs on new array (the loop variable no longer shadows 'dim')
+    for k in set(da.dims) & set(da_o.dims):
+        da_o[k].attrs.update(da[k].attrs)
+    if cache_file is not None:
+        # store the result for the next run with identical inputs (xeofs leaves dict-valued attrs on the components
+        # that netCDF cannot serialize, so they are stringified in the stored copy)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        da_c = da_o.copy(deep=False)
+        da_c.attrs = dict(
+            (k1, k2 if isinstance(k2, (str, bytes, int, float, list, tuple, numpy__ndarray)) else str(k2))
+            for k1, k2 in da_o.attrs.items())
+        da_c.to_netcdf(path=cache_file)
     return da_o
 # ---------------------------------------------------------------------------------------------------------------------#
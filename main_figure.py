@@ -7,28 +7,43 @@
 # ---------------------------------------------------#
 # Import packages
 # ---------------------------------------------------#
-# local functions
-import ensoclopedia.script_figures as fig
+# basic python package
+from argparse import ArgumentParser as argparse__ArgumentParser
+from importlib import import_module as importlib__import_module
+from multiprocessing import get_context as multiprocessing__get_context
 # ---------------------------------------------------#
 
 
-# collect figure scripts
+# figure scripts: name -> (module, function), imported on demand so that plotting one figure does not pay for the
+# heavy imports (matplotlib, cartopy, ...) of all the others
 figures = {
-    "f1": fig.f01_plot,
-    "f7": fig.f07_plot,
+    "f1": ("ensoclopedia.script_figures.figure_01", "f01_plot"),
+    "f7": ("ensoclopedia.script_figures.figure_07", "f07_plot"),
 }
 
 figure_names = sorted(list(figures.keys()), key=lambda v: v.lower())
-figure_names_print = ", ".join(figure_names)
+
+
+def run_figure(name: str):
+    module, function = figures[name]
+    getattr(importlib__import_module(module), function)()
+
 
 print(__name__)
 if __name__ == '__main__':
-    name = input("Which figure do you want to plot?\n     Please enter one of: %s\n" % figure_names_print)
-    while name not in figure_names + ["all"]:
-        name = input("Given value %s does not correspond to a script\n     Please enter one of: %s\n" % (
-            name, figure_names_print))
-    if name == "all":
-        for k in figure_names:
-            figures[k]()
+    # command-line interface (no blocking input() prompt, so figures can be launched from batch jobs or CI)
+    parser = argparse__ArgumentParser(description="Plot figures")
+    parser.add_argument("name", choices=figure_names + ["all"], help="figure to plot, or 'all' to plot every figure")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of figures plotted in parallel when 'all' is selected")
+    args = parser.parse_args()
+    if args.name == "all":
+        if args.jobs > 1:
+            # the figure scripts share no state: plot them in separate processes
+            with multiprocessing__get_context("spawn").Pool(min(args.jobs, len(figure_names))) as pool:
+                pool.map(run_figure, figure_names)
+        else:
+            for k in figure_names:
+                run_figure(k)
     else:
-        figures[name]()
+        run_figure(args.name)
@@ -7,33 +7,45 @@
 # ---------------------------------------------------#
 # Import packages
 # ---------------------------------------------------#
-# local functions
-import ensoclopedia.script_preprocess as proc
+# basic python package
+from argparse import ArgumentParser as argparse__ArgumentParser
+from importlib import import_module as importlib__import_module
+
+# dask
+from dask import compute as dask__compute
+from dask import delayed as dask__delayed
 # ---------------------------------------------------#
 
 
-# collect process scripts
+# process scripts: name -> (module, function), imported on demand so that running one script does not pay for the
+# heavy imports (xarray, xeofs, ...) of all the others
 scripts = {
-    "f1a": proc.f01a_sst_eof_process,
-    "f1b": proc.f01b_ts_time_series_process,
-    "f1c": proc.f01c_gsat_reg_on_enso_process,
-    "f1d": proc.f01d_pr_change_process,
-    "f1e": proc.f01e_pr_change_process,
-    "f7a": proc.f07a_precursors_process,
-    # "t1": proc.t01_ssta_process,
+    "f1a": ("ensoclopedia.script_preprocess.f01a_sst_eof", "f01a_sst_eof_process"),
+    "f1b": ("ensoclopedia.script_preprocess.f01b_ts_time_series", "f01b_ts_time_series_process"),
+    "f1c": ("ensoclopedia.script_preprocess.f01c_gsat_reg_on_enso", "f01c_gsat_reg_on_enso_process"),
+    "f1d": ("ensoclopedia.script_preprocess.f01d_pr_change", "f01d_pr_change_process"),
+    "f1e": ("ensoclopedia.script_preprocess.f01e_pr_range", "f01e_pr_change_process"),
+    "f7a": ("ensoclopedia.script_preprocess.f07a_precursors", "f07a_precursors_process"),
+    # "t1": ("ensoclopedia.script_preprocess.t01_ssta", "t01_ssta_process"),
 }
 
 scripts_names = sorted(list(scripts.keys()), key=lambda v: v.lower())
-scripts_names_print = ", ".join(scripts_names)
+
+
+def run_script(name: str):
+    module, function = scripts[name]
+    getattr(importlib__import_module(module), function)()
+
 
 print(__name__)
 if __name__ == '__main__':
-    name = input("Which script do you want to run?\n     Please enter one of: %s\n" % scripts_names_print)
-    while name not in scripts_names + ["all"]:
-        name = input("Given value %s does not correspond to a script\n     Please enter one of: %s\n" % (
-            name, scripts_names_print))
-    if name == "all":
-        for k in scripts_names:
-            scripts[k]()
+    # command-line interface (no blocking input() prompt, so scripts can be launched from batch jobs or CI)
+    parser = argparse__ArgumentParser(description="Analyze input data")
+    parser.add_argument("name", choices=scripts_names + ["all"], help="script to run, or 'all' to run every script")
+    args = parser.parse_args()
+    if args.name == "all":
+        # the process scripts share no state: schedule them with dask so they run in parallel instead of one after
+        # the other (wall-clock time becomes the slowest script instead of the sum of all scripts)
+        dask__compute(*[dask__delayed(run_script)(k) for k in scripts_names], scheduler="processes")
     else:
-        scripts[name]()
+        run_script(args.name)